@@ -2,6 +2,7 @@
 API client for communicating with external structural analysis services
 """
 import requests
+from requests.auth import AuthBase
 import json
 import time
 from threading import Lock
@@ -10,6 +11,53 @@ from datetime import datetime, timedelta
 from utils.logger import logger
 from utils.config import Config
 
+# Process-wide HTTP session so every APIClient reuses pooled keep-alive connections
+_SESSION = None
+_SESSION_LOCK = Lock()
+
+def _get_shared_session(max_retries, retry_delay):
+    """Return the shared HTTP session, creating it on first use"""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = requests.Session()
+            session.headers.update({
+                'User-Agent': f'AutoCAD-Structural-Plugin/{Config.get("plugin_version", "1.0.0")}',
+                'Content-Type': 'application/json',
+                'Accept': 'application/json'
+            })
+            
+            # Set up retry strategy
+            from requests.adapters import HTTPAdapter
+            from requests.packages.urllib3.util.retry import Retry
+            
+            retry_strategy = Retry(
+                total=max_retries,
+                backoff_factor=retry_delay,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE", "POST"]
+            )
+            
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry_strategy)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            
+            _SESSION = session
+            
+        return _SESSION
+
+class _BearerAuth(AuthBase):
+    """Adds one client's bearer token to its requests on the shared session"""
+    
+    def __init__(self, client):
+        self._client = client
+        
+    def __call__(self, request):
+        token = self._client._auth_token
+        if token:
+            request.headers['Authorization'] = f'Bearer {token}'
+        return request
+
 class APIClient:
     """HTTP client for external API communication"""
     
@@ -24,32 +72,14 @@ class APIClient:
         self._auth_token = None
         self._token_expiry = None
         self._lock = Lock()
+        # Token travels per request: the session is shared by every client
+        self._auth = _BearerAuth(self)
         self._initialize_session()
         
     def _initialize_session(self):
         """Initialize HTTP session with proper headers"""
         try:
-            self.session = requests.Session()
-            self.session.headers.update({
-                'User-Agent': f'AutoCAD-Structural-Plugin/{Config.get("plugin_version", "1.0.0")}',
-                'Content-Type': 'application/json',
-                'Accept': 'application/json'
-            })
-            
-            # Set up retry strategy
-            from requests.adapters import HTTPAdapter
-            from requests.packages.urllib3.util.retry import Retry
-            
-            retry_strategy = Retry(
-                total=self.max_retries,
-                backoff_factor=self.retry_delay,
-                status_forcelist=[429, 500, 502, 503, 504],
-                allowed_methods=["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE", "POST"]
-            )
-            
-            adapter = HTTPAdapter(max_retries=retry_strategy)
-            self.session.mount("http://", adapter)
-            self.session.mount("https://", adapter)
+            self.session = _get_shared_session(self.max_retries, self.retry_delay)
             
             logger.debug("API client session initialized")
             
@@ -98,9 +128,6 @@ class APIClient:
                 expires_in = auth_data.get('expires_in', 3600)
                 self._token_expiry = datetime.now() + timedelta(seconds=expires_in - 300)
                 
-                # Update session headers
-                self.session.headers['Authorization'] = f'Bearer {self._auth_token}'
-                
                 logger.info("Successfully authenticated with API")
                 return True
             else:
@@ -122,6 +149,7 @@ class APIClient:
             response = self.session.get(
                 url,
                 params=params,
+                auth=self._auth,
                 timeout=self.timeout
             )
             
@@ -142,6 +170,7 @@ class APIClient:
             response = self.session.post(
                 url,
                 json=data,
+                auth=self._auth,
                 timeout=self.timeout
             )
             
@@ -151,6 +180,33 @@ class APIClient:
             logger.error(f"POST request failed for {endpoint}: {str(e)}")
             return None
             
+    def post_conditional(self, endpoint, data, etag=None):
+        """Perform POST request revalidated with If-None-Match, returns (data, etag)"""
+        try:
+            if not self._ensure_authentication():
+                return None, etag
+                
+            url = f"{self.base_url}{endpoint}"
+            headers = {'If-None-Match': etag} if etag else None
+            
+            response = self.session.post(
+                url,
+                json=data,
+                headers=headers,
+                auth=self._auth,
+                timeout=self.timeout
+            )
+            
+            if response.status_code == 304:
+                logger.debug(f"POST {endpoint} - Status: 304 - Not modified")
+                return {'not_modified': True}, etag
+                
+            return self._handle_response(response, 'POST', endpoint), response.headers.get('ETag')
+            
+        except Exception as e:
+            logger.error(f"Conditional POST request failed for {endpoint}: {str(e)}")
+            return None, etag
+            
     def put(self, endpoint, data):
         """Perform PUT request to API"""
         try:
@@ -162,6 +218,7 @@ class APIClient:
             response = self.session.put(
                 url,
                 json=data,
+                auth=self._auth,
                 timeout=self.timeout
             )
             
@@ -181,6 +238,7 @@ class APIClient:
             
             response = self.session.delete(
                 url,
+                auth=self._auth,
                 timeout=self.timeout
             )
             
@@ -250,6 +308,7 @@ class APIClient:
                     url,
                     files=files,
                     data=data,
+                    auth=self._auth,
                     timeout=60  # Longer timeout for file uploads
                 )
                 
@@ -270,6 +329,7 @@ class APIClient:
             response = self.session.get(
                 url,
                 stream=True,
+                auth=self._auth,
                 timeout=60
             )
             
@@ -292,6 +352,7 @@ class APIClient:
         try:
             response = self.session.get(
                 f"{self.base_url}/api/health",
+                auth=self._auth,
                 timeout=10
             )
             
@@ -350,8 +411,12 @@ class APIClient:
     def disconnect(self):
         """Clean up resources"""
         try:
-            if self.session:
+            # The pooled session is shared with other clients; only a private
+            # fallback session is closed here
+            if self.session and self.session is not _SESSION:
                 self.session.close()
+            self._auth_token = None
+            self._token_expiry = None
             logger.info("API client disconnected")
         except Exception as e:
             logger.error(f"Error disconnecting API client: {str(e)}")
\ No newline at end of file
@@ -5,25 +5,54 @@ import json
 import pickle
 import sqlite3
 import os
-from datetime import datetime, timedelta
+import threading
+from datetime import datetime, timedelta, timezone
 from threading import Lock, RLock
 
 from utils.logger import logger
-from utils.config import Config
+from utils.config import config
+
+# Persistent cache statistics gathered in a single table scan
+AGG_SQL = '''
+    SELECT COUNT(*),
+           SUM(CASE WHEN expires_at <= CURRENT_TIMESTAMP THEN 1 ELSE 0 END),
+           SUM(LENGTH(value)),
+           AVG(access_count)
+    FROM cache
+'''
+
+def _utcnow():
+    """Naive UTC now, the same clock SQLite uses for CURRENT_TIMESTAMP"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
 class CacheManager:
     """Cache management with persistence and expiration"""
     
     def __init__(self):
-        self.cache_dir = Config.get('cache_dir', 'cache')
-        self.max_cache_size = Config.get('max_cache_size', 100 * 1024 * 1024)  # 100MB
-        self.default_ttl = Config.get('default_ttl', 3600)  # 1 hour
+        self.cache_dir = config.get('cache_dir', 'cache')
+        self.max_cache_size = config.get('max_cache_size', 100 * 1024 * 1024)  # 100MB
+        self.default_ttl = config.get('default_ttl', 3600)  # 1 hour
+        self.sweep_interval = config.get('cache_sweep_interval', 60)  # seconds
+        if not isinstance(self.sweep_interval, (int, float)) or self.sweep_interval <= 0:
+            logger.warning(f"Invalid cache_sweep_interval {self.sweep_interval!r}, using 60 seconds")
+            self.sweep_interval = 60
+        self.stats_approx = config.get('cache_stats_approx', True)
         
         self._memory_cache = {}
         self._db_connection = None
         self._lock = RLock()
         self._initialized = False
         
+        self._closed = False
+        self._closed_event = threading.Event()
+        self._sweeper = None
+        
+        # Persistent entries mirrored as key -> [size_bytes, expires_at, access_count],
+        # with running totals, so get_stats needs no SQL; updated on every write
+        self._persistent_index = {}
+        self._persistent_bytes = 0
+        self._persistent_accesses = 0
+        
         self._initialize_cache()
         
     def _initialize_cache(self):
@@ -36,10 +65,15 @@ class CacheManager:
             db_path = os.path.join(self.cache_dir, 'cache.db')
             self._db_connection = sqlite3.connect(db_path, check_same_thread=False)
             self._create_cache_tables()
+            self._load_persistent_index()
             
             # Clean up expired entries on startup
             self._cleanup_expired()
             
+            # Expiry and size limits are enforced off the write path
+            self._sweeper = threading.Thread(target=self._sweep_loop, daemon=True)
+            self._sweeper.start()
+            
             self._initialized = True
             logger.info("Cache manager initialized successfully")
             
@@ -80,6 +114,30 @@ class CacheManager:
         except Exception as e:
             logger.error(f"Error creating cache tables: {str(e)}")
             
+    def _load_persistent_index(self):
+        """Build the in-memory index of persistent entries in one scan"""
+        cursor = self._db_connection.cursor()
+        cursor.execute('SELECT key, LENGTH(value), expires_at, access_count FROM cache')
+        for key, size, expires_at, access_count in cursor.fetchall():
+            self._index_put(key, size or 0,
+                            datetime.fromisoformat(expires_at) if expires_at else None,
+                            access_count or 0)
+            
+    def _index_put(self, key, size, expires_at, access_count=0):
+        """Record a persistent entry in the index, replacing any previous one"""
+        self._index_drop((key,))
+        self._persistent_index[key] = [size, expires_at, access_count]
+        self._persistent_bytes += size
+        self._persistent_accesses += access_count
+        
+    def _index_drop(self, keys):
+        """Remove persistent entries from the index"""
+        for key in keys:
+            entry = self._persistent_index.pop(key, None)
+            if entry is not None:
+                self._persistent_bytes -= entry[0]
+                self._persistent_accesses -= entry[2]
+            
     def set(self, key, value, ttl=None, persistent=True):
         """Set cache value with optional TTL"""
         try:
@@ -87,13 +145,13 @@ class CacheManager:
                 if ttl is None:
                     ttl = self.default_ttl
                     
-                expires_at = datetime.now() + timedelta(seconds=ttl)
+                expires_at = _utcnow() + timedelta(seconds=ttl)
                 
                 # Store in memory cache
                 self._memory_cache[key] = {
                     'value': value,
                     'expires_at': expires_at,
-                    'created_at': datetime.now(),
+                    'created_at': _utcnow(),
                     'access_count': 0
                 }
                 
@@ -122,9 +180,7 @@ class CacheManager:
             ''', (key, serialized_value, expires_at))
             
             self._db_connection.commit()
-            
-            # Check cache size and cleanup if needed
-            self._enforce_cache_limits()
+            self._index_put(key, len(serialized_value), expires_at)
             
         except Exception as e:
             logger.error(f"Error setting persistent cache for key {key}: {str(e)}")
@@ -136,7 +192,7 @@ class CacheManager:
                 # First check memory cache
                 if key in self._memory_cache:
                     cache_item = self._memory_cache[key]
-                    if cache_item['expires_at'] > datetime.now():
+                    if cache_item['expires_at'] > _utcnow():
                         # Update access statistics
                         cache_item['access_count'] += 1
                         logger.debug(f"Cache hit (memory) for key: {key}")
@@ -149,7 +205,7 @@ class CacheManager:
                 persistent_value = self._get_persistent(key)
                 if persistent_value is not None:
                     # Also store in memory cache for faster access
-                    ttl = (persistent_value['expires_at'] - datetime.now()).total_seconds()
+                    ttl = (persistent_value['expires_at'] - _utcnow()).total_seconds()
                     if ttl > 0:
                         self.set(key, persistent_value['value'], ttl=ttl, persistent=False)
                     logger.debug(f"Cache hit (persistent) for key: {key}")
@@ -184,6 +240,11 @@ class CacheManager:
                 ''', (key,))
                 self._db_connection.commit()
                 
+                entry = self._persistent_index.get(key)
+                if entry is not None:
+                    entry[2] += 1
+                    self._persistent_accesses += 1
+                
                 # Deserialize value
                 value = pickle.loads(value_data)
                 return {
@@ -209,6 +270,7 @@ class CacheManager:
                 cursor = self._db_connection.cursor()
                 cursor.execute('DELETE FROM cache WHERE key = ?', (key,))
                 self._db_connection.commit()
+                self._index_drop((key,))
                 
                 logger.debug(f"Cache deleted for key: {key}")
                 return True
@@ -223,7 +285,7 @@ class CacheManager:
             with self._lock:
                 # Check memory cache
                 if key in self._memory_cache:
-                    if self._memory_cache[key]['expires_at'] > datetime.now():
+                    if self._memory_cache[key]['expires_at'] > _utcnow():
                         return True
                     else:
                         del self._memory_cache[key]
@@ -261,12 +323,16 @@ class CacheManager:
                 # Clear persistent cache
                 cursor = self._db_connection.cursor()
                 if pattern:
-                    cursor.execute('DELETE FROM cache WHERE key LIKE ?', (f'%{pattern}%',))
+                    like = (f'%{pattern}%',)
+                    matched = [row[0] for row in cursor.execute('SELECT key FROM cache WHERE key LIKE ?', like)]
+                    cursor.execute('DELETE FROM cache WHERE key LIKE ?', like)
                 else:
+                    matched = list(self._persistent_index)
                     cursor.execute('DELETE FROM cache')
                     
                 cleared_count += cursor.rowcount
                 self._db_connection.commit()
+                self._index_drop(matched)
                 
                 logger.info(f"Cleared {cleared_count} cache entries")
                 return cleared_count
@@ -280,7 +346,7 @@ class CacheManager:
         try:
             with self._lock:
                 # Clean memory cache
-                current_time = datetime.now()
+                current_time = _utcnow()
                 expired_keys = [
                     key for key, item in self._memory_cache.items() 
                     if item['expires_at'] <= current_time
@@ -290,9 +356,12 @@ class CacheManager:
                     
                 # Clean persistent cache
                 cursor = self._db_connection.cursor()
+                expired = [row[0] for row in cursor.execute(
+                    'SELECT key FROM cache WHERE expires_at <= CURRENT_TIMESTAMP')]
                 cursor.execute('DELETE FROM cache WHERE expires_at <= CURRENT_TIMESTAMP')
                 deleted_count = cursor.rowcount
                 self._db_connection.commit()
+                self._index_drop(expired)
                 
                 if deleted_count > 0:
                     logger.debug(f"Cleaned up {deleted_count} expired cache entries")
@@ -300,27 +369,37 @@ class CacheManager:
         except Exception as e:
             logger.error(f"Error cleaning up expired cache: {str(e)}")
             
+    def _sweep_loop(self):
+        """Background worker for periodic cleanup and size enforcement"""
+        while not self._closed:
+            self._closed_event.wait(self.sweep_interval)
+            if self._closed:
+                break
+            self._cleanup_expired()
+            try:
+                with self._lock:
+                    self._enforce_cache_limits()
+            except Exception as e:
+                logger.error(f"Error in cache sweeper: {str(e)}")
+                
     def _enforce_cache_limits(self):
         """Enforce cache size limits"""
         try:
             cursor = self._db_connection.cursor()
             
-            # Get current cache size
-            cursor.execute('SELECT SUM(LENGTH(value)) FROM cache')
-            result = cursor.fetchone()
-            current_size = result[0] or 0
+            # Current cache size comes from the index totals
+            current_size = self._persistent_bytes
             
             if current_size > self.max_cache_size:
                 # Remove least recently used items
-                cursor.execute('''
-                    DELETE FROM cache 
-                    WHERE key IN (
-                        SELECT key FROM cache 
-                        ORDER BY last_accessed ASC 
-                        LIMIT (SELECT COUNT(*) * 0.1 FROM cache)
-                    )
-                ''')
+                evicted = [row[0] for row in cursor.execute('''
+                    SELECT key FROM cache 
+                    ORDER BY last_accessed ASC 
+                    LIMIT (SELECT CAST(COUNT(*) * 0.1 AS INTEGER) FROM cache)
+                ''')]
+                cursor.executemany('DELETE FROM cache WHERE key = ?', [(key,) for key in evicted])
                 self._db_connection.commit()
+                self._index_drop(evicted)
                 
                 logger.info(f"Cache size limit enforced, removed old entries")
                 
@@ -331,45 +410,55 @@ class CacheManager:
         """Get cache statistics"""
         try:
             with self._lock:
-                cursor = self._db_connection.cursor()
-                
                 # Memory cache stats
                 memory_stats = {
                     'entries': len(self._memory_cache),
                     'expired_entries': len([
                         k for k, v in self._memory_cache.items() 
-                        if v['expires_at'] <= datetime.now()
+                        if v['expires_at'] <= _utcnow()
                     ])
                 }
                 
-                # Persistent cache stats
-                cursor.execute('SELECT COUNT(*) FROM cache')
-                persistent_entries = cursor.fetchone()[0]
-                
-                cursor.execute('SELECT COUNT(*) FROM cache WHERE expires_at <= CURRENT_TIMESTAMP')
-                expired_persistent = cursor.fetchone()[0]
-                
-                cursor.execute('SELECT SUM(LENGTH(value)) FROM cache')
-                total_size = cursor.fetchone()[0] or 0
-                
-                cursor.execute('SELECT AVG(access_count) FROM cache')
-                avg_access = cursor.fetchone()[0] or 0
-                
+                # Persistent cache stats from the in-memory index, or exact from SQL
+                if self.stats_approx:
+                    persistent_stats = self._index_stats()
+                else:
+                    persistent_stats = self._collect_persistent_stats()
+                    
                 return {
                     'memory_cache': memory_stats,
-                    'persistent_cache': {
-                        'entries': persistent_entries,
-                        'expired_entries': expired_persistent,
-                        'total_size_bytes': total_size,
-                        'average_access_count': round(avg_access, 2)
-                    },
-                    'total_entries': memory_stats['entries'] + persistent_entries
+                    'persistent_cache': persistent_stats,
+                    'total_entries': memory_stats['entries'] + persistent_stats['entries']
                 }
                 
         except Exception as e:
             logger.error(f"Error getting cache stats: {str(e)}")
             return {}
             
+    def _collect_persistent_stats(self):
+        """Gather persistent cache statistics in one query"""
+        cursor = self._db_connection.cursor()
+        total, expired, size, avg_access = cursor.execute(AGG_SQL).fetchone()
+        
+        return {
+            'entries': total,
+            'expired_entries': expired or 0,
+            'total_size_bytes': size or 0,
+            'average_access_count': round(avg_access or 0, 2)
+        }
+        
+    def _index_stats(self):
+        """Persistent cache statistics from the in-memory index"""
+        now = _utcnow()
+        entries = len(self._persistent_index)
+        return {
+            'entries': entries,
+            'expired_entries': sum(1 for _, expires_at, _ in self._persistent_index.values()
+                                   if expires_at is not None and expires_at <= now),
+            'total_size_bytes': self._persistent_bytes,
+            'average_access_count': round(self._persistent_accesses / entries, 2) if entries else 0
+        }
+            
     def prefetch(self, keys_with_ttl):
         """Prefetch multiple keys into cache"""
         try:
@@ -389,6 +478,11 @@ class CacheManager:
     def close(self):
         """Close cache and clean up resources"""
         try:
+            self._closed = True
+            self._closed_event.set()
+            if self._sweeper and self._sweeper is not threading.current_thread():
+                self._sweeper.join(timeout=5)
+                
             with self._lock:
                 if self._db_connection:
                     self._db_connection.close()
@@ -4,12 +4,14 @@ License management service for the AutoCAD structural plugin
 import hashlib
 import uuid
 import json
+import secrets
 import socket
 from datetime import datetime, timedelta
 from threading import Lock
 
 from utils.logger import logger
-from utils.config import Config
+from utils.config import config
+from utils.helpers import iso_now
 from .api_client import APIClient
 from .cache_manager import CacheManager
 
@@ -27,21 +29,38 @@ class LicenseService:
         self._validation_lock = Lock()
         self._last_validation = None
         self._validation_interval = timedelta(hours=1)  # Revalidate every hour
+        self._validity_cache = (None, None, None)  # ((license_key, expires_at), expiry_dt, is_valid)
+        self._feature_set = None
+        self._features_tuple = ()
+        self._license_etag = None
         
         self._load_license_data()
         
     def _get_machine_id(self):
-        """Generate unique machine identifier"""
+        """Get unique machine identifier, computed once and stored in config"""
         try:
+            machine_id = config.get('machine_id')
+            if machine_id:
+                return machine_id
+                
             # Use combination of hostname and MAC address
             hostname = socket.gethostname()
+            mac = ':'.join(f'{b:02x}' for b in uuid.getnode().to_bytes(6, 'big'))
             
-            # Get MAC address (platform-specific)
-            mac = ':'.join(['{:02x}'.format((uuid.getnode() >> elements) & 0xff) 
-                           for elements in range(0, 8*6, 8)][::-1])
-            
+            # Keyed BLAKE2b yields the 32-char digest directly, no truncation
             machine_string = f"{hostname}_{mac}"
-            return hashlib.sha256(machine_string.encode()).hexdigest()[:32]
+            # Per-installation salt, generated once and kept next to the ID
+            salt = config.get('machine_id_salt')
+            if not salt:
+                salt = secrets.token_hex(16)
+                config.set('machine_id_salt', salt, save=False)
+            machine_id = hashlib.blake2b(
+                machine_string.encode('utf-8'), digest_size=16, key=salt.encode('utf-8')
+            ).hexdigest()
+            
+            config.set('machine_id', machine_id)
+            config.save()
+            return machine_id
             
         except Exception as e:
             logger.error(f"Error generating machine ID: {str(e)}")
@@ -54,7 +73,8 @@ class LicenseService:
             cached_license = self.cache_manager.get('license_data')
             if cached_license:
                 self.license_data = cached_license
-                self.license_key = Config.get('license_key')
+                self._reset_license_cache()
+                self.license_key = config.get('license_key')
                 logger.debug("License data loaded from cache")
                 
         except Exception as e:
@@ -62,16 +82,28 @@ class LicenseService:
             
     def validate_license(self, license_key=None):
         """Validate license key"""
+        # Lock-free fast path: recent validation of the same key needs no server call
+        license_data = self.license_data
+        last_validation = self._last_validation
+        if (self.license_key and
+            (not license_key or license_key == self.license_key) and
+            last_validation and
+            license_data and
+            datetime.now() - last_validation < self._validation_interval):
+            return self._is_license_valid(license_data)
+            
         with self._validation_lock:
             try:
                 if license_key:
+                    if license_key != self.license_key:
+                        self._license_etag = None
                     self.license_key = license_key
                     
                 if not self.license_key:
                     logger.error("No license key provided")
                     return False
                     
-                # Check if we recently validated
+                # Re-check under the lock, another thread may have just validated
                 if (self._last_validation and 
                     self.license_data and 
                     datetime.now() - self._last_validation < self._validation_interval):
@@ -83,13 +115,14 @@ class LicenseService:
                 if validation_result:
                     self.license_data = validation_result
                     self._last_validation = datetime.now()
+                    self._reset_license_cache()
                     
                     # Cache license data
                     self.cache_manager.set('license_data', validation_result, ttl=3600)
                     
                     # Save license key to config
-                    Config.set('license_key', self.license_key)
-                    Config.save()
+                    config.set('license_key', self.license_key)
+                    config.save()
                     
                     logger.info("License validation successful")
                     return True
@@ -107,13 +140,20 @@ class LicenseService:
             payload = {
                 'license_key': self.license_key,
                 'machine_id': self.machine_id,
-                'plugin_version': Config.get('plugin_version', '1.0.0'),
-                'validation_timestamp': datetime.now().isoformat()
+                'plugin_version': config.get('plugin_version', '1.0.0'),
+                'validation_timestamp': iso_now()
             }
             
-            response = self.api_client.post('/api/license/validate', payload)
+            response, etag = self.api_client.post_conditional(
+                '/api/license/validate', payload, etag=self._license_etag
+            )
             
+            # Server state unchanged since the last validation
+            if response and response.get('not_modified') and self.license_data:
+                return self.license_data
+                
             if response and response.get('valid'):
+                self._license_etag = etag
                 return response.get('license_data')
             else:
                 logger.warning(f"License server response: {response}")
@@ -129,30 +169,53 @@ class LicenseService:
             if not license_data:
                 return False
                 
-            # Check expiration
+            # Reuse the last decision for the same license key and expiry while unexpired;
+            # new license data resets the cache
             expiry_str = license_data.get('expires_at')
-            if expiry_str:
-                expiry_date = datetime.fromisoformat(expiry_str)
-                if expiry_date < datetime.now():
-                    logger.warning("License has expired")
-                    return False
-                    
-            # Check features
-            if not license_data.get('features'):
-                logger.warning("No features in license")
-                return False
+            cache_key = (self.license_key, expiry_str)
+            cached_key, cached_expiry, cached_valid = self._validity_cache
+            if cached_key == cache_key and (cached_expiry is None or cached_expiry > datetime.now()):
+                return cached_valid
                 
-            # Check machine binding
-            if license_data.get('machine_bound') and license_data.get('machine_id') != self.machine_id:
-                logger.warning("License not valid for this machine")
-                return False
-                
-            return True
+            expiry_date = datetime.fromisoformat(expiry_str) if expiry_str else None
+            
+            is_valid = self._check_license_data(license_data, expiry_date)
+            self._validity_cache = (cache_key, expiry_date, is_valid)
+            return is_valid
             
         except Exception as e:
             logger.error(f"Error checking license validity: {str(e)}")
             return False
             
+    def _check_license_data(self, license_data, expiry_date):
+        """Run the license validity checks against parsed expiry"""
+        # Check expiration
+        if expiry_date and expiry_date < datetime.now():
+            logger.warning("License has expired")
+            return False
+            
+        # Check features
+        if not license_data.get('features'):
+            logger.warning("No features in license")
+            return False
+            
+        # Check machine binding
+        if license_data.get('machine_bound') and license_data.get('machine_id') != self.machine_id:
+            logger.warning("License not valid for this machine")
+            return False
+            
+        return True
+        
+    def _reset_license_cache(self):
+        """Rebuild values derived from the current license data"""
+        self._validity_cache = (None, None, None)
+        if self.license_data:
+            self._features_tuple = tuple(self.license_data.get('features') or ())
+            self._feature_set = frozenset(self._features_tuple)
+        else:
+            self._features_tuple = ()
+            self._feature_set = None
+            
     def get_license_info(self):
         """Get comprehensive license information"""
         try:
@@ -168,7 +231,7 @@ class LicenseService:
                 'status': 'valid' if is_valid else 'invalid',
                 'license_type': self.license_data.get('type', 'unknown'),
                 'expires_at': self.license_data.get('expires_at'),
-                'features': self.license_data.get('features', []),
+                'features': self._features_tuple or (),
                 'machine_bound': self.license_data.get('machine_bound', False),
                 'last_validation': self._last_validation.isoformat() if self._last_validation else None,
                 'days_remaining': self._get_days_remaining()
@@ -202,11 +265,10 @@ class LicenseService:
     def has_feature(self, feature_name):
         """Check if license includes specific feature"""
         try:
-            if not self.license_data:
+            if self._feature_set is None:
                 return False
                 
-            features = self.license_data.get('features', [])
-            return feature_name in features
+            return feature_name in self._feature_set
             
         except Exception as e:
             logger.error(f"Error checking feature {feature_name}: {str(e)}")
@@ -218,7 +280,7 @@ class LicenseService:
             if not self.license_data:
                 return []
                 
-            return self.license_data.get('features', [])
+            return list(self._features_tuple)
             
         except Exception as e:
             logger.error(f"Error getting available features: {str(e)}")
@@ -230,7 +292,7 @@ class LicenseService:
             payload = {
                 'email': email,
                 'machine_id': self.machine_id,
-                'plugin_version': Config.get('plugin_version', '1.0.0')
+                'plugin_version': config.get('plugin_version', '1.0.0')
             }
             
             response = self.api_client.post('/api/license/trial', payload)
@@ -239,11 +301,12 @@ class LicenseService:
                 trial_license = response.get('license_data')
                 if trial_license:
                     self.license_data = trial_license
+                    self._reset_license_cache()
                     self.license_key = trial_license.get('license_key')
                     
                     # Save to config
-                    Config.set('license_key', self.license_key)
-                    Config.save()
+                    config.set('license_key', self.license_key)
+                    config.save()
                     
                     # Cache license data
                     self.cache_manager.set('license_data', trial_license, ttl=3600)
@@ -273,10 +336,12 @@ class LicenseService:
             # Clear local license data
             self.license_data = None
             self.license_key = None
+            self._license_etag = None
+            self._reset_license_cache()
             
             # Clear from config and cache
-            Config.set('license_key', '')
-            Config.save()
+            config.set('license_key', '')
+            config.save()
             self.cache_manager.delete('license_data')
             
             logger.info("License deactivated successfully")
@@ -294,7 +359,7 @@ class LicenseService:
                 
             payload = {
                 'license_key': self.license_key,
-                'current_version': Config.get('plugin_version', '1.0.0')
+                'current_version': config.get('plugin_version', '1.0.0')
             }
             
             response = self.api_client.post('/api/license/updates', payload)
@@ -351,6 +416,7 @@ class LicenseService:
         """Force refresh of license data from server"""
         try:
             self._last_validation = None  # Force revalidation
+            self._reset_license_cache()
             return self.validate_license()
             
         except Exception as e:
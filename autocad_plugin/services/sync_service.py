@@ -4,20 +4,95 @@ Synchronization service for structural data between AutoCAD and external systems
 import threading
 import time
 import json
-from queue import Queue, PriorityQueue, Empty
+import collections
+import functools
+import itertools
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict, replace
 from datetime import datetime, timedelta
 from enum import Enum
+from typing import Any, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from utils.logger import logger
-from utils.config import Config
+from utils.config import config
+from utils.helpers import iso_now
 from .api_client import APIClient
 from .cache_manager import CacheManager
 
+# Sync IDs: per-process prefix (keeps cached failed_sync_* keys distinct
+# across sessions) plus an atomic in-process sequence
+_SYNC_ID_PREFIX = f"sync_{int(time.time())}_"
+_SYNC_IDS = itertools.count()
+
+# Slotted dataclasses drop the per-instance __dict__ of the many queued
+# sync items; dataclass(slots=...) needs Python 3.10+
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@functools.lru_cache(maxsize=64)
+def _endpoints_for(entity_type):
+    """Endpoint templates per operation for an entity type"""
+    return {
+        'create': f'/api/structural/{entity_type}s',
+        'update': f'/api/structural/{entity_type}s/{{eid}}',
+        'delete': f'/api/structural/{entity_type}s/{{eid}}',
+        'batch': '/api/structural/batch'
+    }
+
+def _report_default(obj):
+    """JSON fallback for sync reports, shared by the orjson and json encoders"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.name
+    return str(obj)
+
+def _report_dict(fields):
+    """asdict factory that turns enums into names before orjson encodes them natively"""
+    return {key: value.name if isinstance(value, Enum) else value for key, value in fields}
+
 class SyncPriority(Enum):
     HIGH = 1
     NORMAL = 2
     LOW = 3
 
+@dataclass(**DATACLASS_SLOTS)
+class SyncItem:
+    """Unit of work queued for synchronization"""
+    id: str
+    data: Any
+    entity_type: str
+    operation: str
+    priority: SyncPriority
+    timestamp: datetime
+    retry_count: int = 0
+    status: str = 'queued'
+    processing_start: Optional[datetime] = None
+    processing_end: Optional[datetime] = None
+    error: Optional[str] = None
+    not_before: float = 0.0  # time.monotonic() before which a retry is held back
+
+class _AtomicCounter:
+    """Thread-safe counter; a private lock keeps increments off the queue condition"""
+    
+    def __init__(self):
+        self._value = 0
+        self._lock = threading.Lock()
+        
+    def increment(self):
+        with self._lock:
+            self._value += 1
+        
+    @property
+    def value(self):
+        return self._value
+
 class SyncService:
     """Main synchronization service for structural data"""
     
@@ -25,164 +100,294 @@ class SyncService:
         self.api_client = APIClient()
         self.cache_manager = CacheManager()
         
-        self.sync_queue = PriorityQueue()
+        # One FIFO per priority, drained HIGH -> LOW under a single condition
+        self._queues = {p: collections.deque() for p in SyncPriority}
+        self._cv = threading.Condition()
         self.failed_syncs = []
-        self.sync_history = []
+        
+        # Failed items waiting to be written to the cache in one pass
+        self._failed_cache_buffer = collections.OrderedDict()
+        self._failed_cache_buffer_size = 256
+        self._failed_cache_ttl = 86400  # 24 hours
         
         self.is_running = False
         self.sync_thread = None
-        self.sync_interval = Config.get('sync_interval', 10)  # seconds
-        self.max_history_size = Config.get('max_sync_history', 1000)
-        self.max_retries = Config.get('sync_max_retries', 3)
+        self.sync_interval = config.get('sync_interval', 10)  # seconds
+        self.max_history_size = config.get('max_sync_history', 1000)
+        self.sync_history = collections.deque(maxlen=self.max_history_size)
+        self.max_retries = config.get('sync_max_retries', 3)
+        self.retry_delay = config.get('sync_retry_delay', self.sync_interval)  # seconds, doubled per attempt
+        self.batch_size = config.get('sync_batch_size', 10)
+        self.batch_interval = config.get('sync_batch_interval_ms', 200) / 1000.0  # seconds
+        self.max_concurrency = config.get('sync_max_concurrency', 10)
+        self._executor = None
         
-        self._stats = {
-            'successful_syncs': 0,
-            'failed_syncs': 0,
-            'last_sync_time': None,
-            'total_items_processed': 0
-        }
+        self._successful_syncs = _AtomicCounter()
+        self._failed_syncs = _AtomicCounter()
+        self._items_processed = _AtomicCounter()
+        self._last_sync_time = None
         
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
         
     def start(self):
         """Start the synchronization service"""
         if self.is_running:
             logger.warning("Sync service already running")
             return
+        if self.sync_thread and self.sync_thread.is_alive():
+            logger.warning("Previous sync worker is still stopping")
+            return
             
         self.is_running = True
+        if self._executor is None:
+            # Requests issued per cycle run concurrently over the pooled HTTP session
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                                thread_name_prefix='sync')
         self.sync_thread = threading.Thread(target=self._sync_worker, daemon=True)
         self.sync_thread.start()
         logger.info("Synchronization service started")
         
     def stop(self):
         """Stop the synchronization service"""
-        self.is_running = False
+        with self._cv:
+            self.is_running = False
+            self._cv.notify_all()
         if self.sync_thread:
             self.sync_thread.join(timeout=5)
+            if self.sync_thread.is_alive():
+                # The worker shuts its executor down itself once it exits
+                logger.warning("Sync worker still finishing its current batch")
+        self._flush_failed_cache()
         logger.info("Synchronization service stopped")
         
     def queue_sync(self, data, priority=SyncPriority.NORMAL, entity_type=None, operation='create'):
         """Queue data for synchronization"""
         try:
-            sync_item = {
-                'id': self._generate_sync_id(),
-                'data': data,
-                'entity_type': entity_type or data.get('type', 'unknown'),
-                'operation': operation,
-                'priority': priority,
-                'timestamp': datetime.now(),
-                'retry_count': 0,
-                'status': 'queued'
-            }
-            
-            # Calculate priority score (lower = higher priority)
-            priority_score = priority.value
+            sync_item = SyncItem(
+                id=self._generate_sync_id(),
+                data=data,
+                entity_type=entity_type or data.get('type', 'unknown'),
+                operation=operation,
+                priority=priority,
+                timestamp=datetime.now()
+            )
             
-            self.sync_queue.put((priority_score, sync_item))
+            self._enqueue(priority, sync_item)
             
-            with self._lock:
-                self._stats['total_items_processed'] += 1
+            self._items_processed.increment()
                 
-            logger.debug(f"Queued sync item: {sync_item['id']} (priority: {priority.name})")
-            return sync_item['id']
+            logger.debug(f"Queued sync item: {sync_item.id} (priority: {priority.name})")
+            return sync_item.id
             
         except Exception as e:
             logger.error(f"Error queueing sync data: {str(e)}")
             return None
             
+    def _enqueue(self, priority, sync_item):
+        """Append item to its priority queue and wake the worker"""
+        with self._cv:
+            self._queues[priority].append(sync_item)
+            # Completion waiters share the condition, so wake everyone
+            self._cv.notify_all()
+            
+    def _pending_count(self):
+        """Number of items waiting in all priority queues"""
+        return sum(len(q) for q in self._queues.values())
+        
+    def _any_pending(self):
+        """Whether any priority queue has items waiting"""
+        return any(self._queues.values())
+        
+    def _any_due(self):
+        """Whether any queued item may be synced now (caller holds _cv)"""
+        now = time.monotonic()
+        return any(item.not_before <= now for queue in self._queues.values() for item in queue)
+        
+    def _wait_timeout(self):
+        """Seconds until the next held-back retry is due, capped at sync_interval"""
+        now = time.monotonic()
+        delays = [item.not_before - now for queue in self._queues.values()
+                  for item in queue if item.not_before > now]
+        return min(delays + [self.sync_interval])
+        
+    def _drain(self, max_items):
+        """Pop up to max_items that are due, highest priority first (caller holds _cv)"""
+        now = time.monotonic()
+        items = []
+        for priority in SyncPriority:
+            queue = self._queues[priority]
+            held_back = []
+            while queue and len(items) < max_items:
+                item = queue.popleft()
+                (items if item.not_before <= now else held_back).append(item)
+            # Retries not yet due go back to the front in their original order
+            queue.extendleft(reversed(held_back))
+        return items
+        
     def _generate_sync_id(self):
         """Generate unique sync ID"""
-        return f"sync_{int(time.time())}_{threading.get_ident()}"
+        return f"{_SYNC_ID_PREFIX}{next(_SYNC_IDS)}"
         
     def _sync_worker(self):
         """Background worker for processing sync queue"""
-        while self.is_running:
-            try:
-                # Process items from queue
-                processed_count = 0
-                while not self.sync_queue.empty() and processed_count < 10:  # Process up to 10 items per cycle
-                    try:
-                        priority, sync_item = self.sync_queue.get_nowait()
-                        self._process_sync_item(sync_item)
-                        processed_count += 1
-                    except Empty:
-                        break
+        try:
+            while self.is_running:
+                try:
+                    with self._cv:
+                        self._cv.wait_for(
+                            lambda: self._any_due() or not self.is_running,
+                            timeout=self._wait_timeout()
+                        )
+                        items = self._drain(self.batch_size)
                         
-                # Wait for next cycle
-                time.sleep(self.sync_interval)
-                
-            except Exception as e:
-                logger.error(f"Error in sync worker: {str(e)}")
-                time.sleep(self.sync_interval)  # Prevent tight loop on errors
+                        # Give producers a short window to fill up a partial batch
+                        if items and len(items) < self.batch_size and self.is_running:
+                            self._cv.wait_for(
+                                lambda: (self._pending_count() >= self.batch_size - len(items)
+                                         or not self.is_running),
+                                timeout=self.batch_interval
+                            )
+                            items.extend(self._drain(self.batch_size - len(items)))
+                            
+                        if not self._any_pending():
+                            self._cv.notify_all()
+                            
+                    if items:
+                        self._flush_batch(items)
+                        
+                    self._flush_failed_cache()
+                    
+                except Exception as e:
+                    logger.error(f"Error in sync worker: {str(e)}")
+                    time.sleep(self.sync_interval)  # Prevent tight loop on errors
+        finally:
+            # Only the worker submits to the executor, so it is torn down
+            # here, after the last submit, rather than by stop()
+            executor, self._executor = self._executor, None
+            if executor:
+                executor.shutdown(wait=True)
                 
     def _process_sync_item(self, sync_item):
         """Process a single sync item"""
         try:
-            sync_item['status'] = 'processing'
-            sync_item['processing_start'] = datetime.now()
+            sync_item.status = 'processing'
+            sync_item.processing_start = datetime.now()
             
             success = self._sync_to_external_service(sync_item)
+            self._complete_sync_item(sync_item, success)
             
-            sync_item['processing_end'] = datetime.now()
-            sync_item['status'] = 'completed' if success else 'failed'
+        except Exception as e:
+            logger.error(f"Error processing sync item {sync_item.id}: {str(e)}")
+            sync_item.status = 'error'
+            sync_item.error = str(e)
+            self._add_to_history(sync_item)
+            
+    def _flush_batch(self, items):
+        """Sync drained items, coalescing same-type operations into batch requests"""
+        groups = {}
+        for sync_item in items:
+            groups.setdefault((sync_item.entity_type, sync_item.operation), []).append(sync_item)
+            
+        jobs = []
+        for (entity_type, operation), group in groups.items():
+            # Deletes carry no payload and batches are already coalesced
+            if operation in ('delete', 'batch') or len(group) == 1:
+                jobs.extend(functools.partial(self._process_sync_item, sync_item) for sync_item in group)
+            else:
+                jobs.append(functools.partial(self._sync_group, entity_type, operation, group))
+                
+        # Keep every request of this cycle in flight at once
+        if len(jobs) == 1 or self._executor is None:
+            for job in jobs:
+                job()
+        else:
+            for future in [self._executor.submit(job) for job in jobs]:
+                future.result()
+                
+    def _sync_group(self, entity_type, operation, group):
+        """Sync a group of same-type items with one batch request"""
+        try:
+            processing_start = datetime.now()
+            for sync_item in group:
+                sync_item.status = 'processing'
+                sync_item.processing_start = processing_start
+                
+            payload = {
+                'batch_id': f"batch_{group[0].id}",
+                'operation': operation,
+                'entity_type': entity_type,
+                'entities': [sync_item.data for sync_item in group],
+                'sync_ids': [sync_item.id for sync_item in group],
+                'timestamp': iso_now()
+            }
+            
+            response = self.api_client.post('/api/structural/batch', payload)
+            success = response is not None and response.get('success', False)
+            
+        except Exception as e:
+            logger.error(f"Error syncing {entity_type} batch: {str(e)}")
+            success = False
+            
+        for sync_item in group:
+            self._complete_sync_item(sync_item, success)
+            
+    def _complete_sync_item(self, sync_item, success):
+        """Record the outcome of a sync attempt and schedule retries"""
+        try:
+            sync_item.processing_end = datetime.now()
+            sync_item.status = 'completed' if success else 'failed'
             
             if success:
-                with self._lock:
-                    self._stats['successful_syncs'] += 1
-                    self._stats['last_sync_time'] = datetime.now()
-                logger.debug(f"Successfully synced item: {sync_item['id']}")
+                self._successful_syncs.increment()
+                self._last_sync_time = datetime.now()
+                logger.debug(f"Successfully synced item: {sync_item.id}")
+                self._add_to_history(sync_item)
             else:
-                with self._lock:
-                    self._stats['failed_syncs'] += 1
-                    
+                self._failed_syncs.increment()
+                
                 # Handle retry logic
-                sync_item['retry_count'] += 1
-                if sync_item['retry_count'] < self.max_retries:
-                    # Re-queue with higher priority
-                    sync_item['priority'] = SyncPriority.HIGH
-                    self.sync_queue.put((SyncPriority.HIGH.value, sync_item))
-                    logger.warning(f"Sync failed, requeuing item {sync_item['id']} "
-                                 f"(attempt {sync_item['retry_count']})")
+                sync_item.retry_count += 1
+                if sync_item.retry_count < self.max_retries:
+                    # Re-queue with higher priority, held back with exponential backoff
+                    delay = self.retry_delay * 2 ** (sync_item.retry_count - 1)
+                    sync_item.not_before = time.monotonic() + delay
+                    sync_item.priority = SyncPriority.HIGH
+                    self._enqueue(SyncPriority.HIGH, sync_item)
+                    logger.warning(f"Sync failed, requeuing item {sync_item.id} "
+                                 f"(attempt {sync_item.retry_count}, retry in {delay:.1f}s)")
                 else:
                     # Max retries exceeded
-                    logger.error(f"Max retries exceeded for sync item: {sync_item['id']}")
+                    logger.error(f"Max retries exceeded for sync item: {sync_item.id}")
                     self._handle_failed_sync(sync_item)
+                    self._add_to_history(sync_item)
                     
-            # Add to history
-            self._add_to_history(sync_item)
-            
         except Exception as e:
-            logger.error(f"Error processing sync item {sync_item['id']}: {str(e)}")
-            sync_item['status'] = 'error'
-            sync_item['error'] = str(e)
+            logger.error(f"Error completing sync item {sync_item.id}: {str(e)}")
+            sync_item.status = 'error'
+            sync_item.error = str(e)
             self._add_to_history(sync_item)
             
     def _sync_to_external_service(self, sync_item):
         """Sync data to external service"""
         try:
-            operation = sync_item['operation']
-            entity_type = sync_item['entity_type']
-            data = sync_item['data']
-            
-            endpoint_map = {
-                'create': f'/api/structural/{entity_type}s',
-                'update': f'/api/structural/{entity_type}s/{data.get("entity_id")}',
-                'delete': f'/api/structural/{entity_type}s/{data.get("entity_id")}',
-                'batch': '/api/structural/batch'
-            }
+            operation = sync_item.operation
+            entity_type = sync_item.entity_type
+            data = sync_item.data
             
-            endpoint = endpoint_map.get(operation)
+            endpoint = _endpoints_for(entity_type).get(operation)
             if not endpoint:
                 logger.error(f"Unknown operation: {operation}")
                 return False
                 
+            if operation in ('update', 'delete'):
+                endpoint = endpoint.format(eid=data.get('entity_id'))
+                
             # Prepare payload
             payload = {
                 'entity_data': data,
                 'operation': operation,
-                'sync_timestamp': datetime.now().isoformat(),
-                'sync_id': sync_item['id']
+                'sync_timestamp': iso_now(),
+                'sync_id': sync_item.id
             }
             
             # Make API call based on operation
@@ -207,41 +412,64 @@ class SyncService:
             # Store in failed syncs list
             self.failed_syncs.append(sync_item)
             
-            # Cache for manual recovery
-            cache_key = f"failed_sync_{sync_item['id']}"
-            self.cache_manager.set(cache_key, sync_item, ttl=86400)  # 24 hours
-            
+            # Buffer for manual recovery, written to cache once per worker cycle
+            evicted = None
+            with self._lock:
+                self._failed_cache_buffer[sync_item.id] = sync_item
+                self._failed_cache_buffer.move_to_end(sync_item.id)
+                if len(self._failed_cache_buffer) > self._failed_cache_buffer_size:
+                    evicted = self._failed_cache_buffer.popitem(last=False)[1]
+                    
+            if evicted is not None:
+                self.cache_manager.set(f"failed_sync_{evicted.id}", evicted, ttl=self._failed_cache_ttl)
+                
             # Log failure
-            logger.error(f"Sync permanently failed for item: {sync_item['id']}")
+            logger.error(f"Sync permanently failed for item: {sync_item.id}")
             
         except Exception as e:
             logger.error(f"Error handling failed sync: {str(e)}")
             
-    def _add_to_history(self, sync_item):
-        """Add sync item to history"""
+    def _flush_failed_cache(self):
+        """Write buffered failed sync items to the cache in one pass"""
         try:
             with self._lock:
-                self.sync_history.append(sync_item.copy())
+                if not self._failed_cache_buffer:
+                    return
+                buffered = self._failed_cache_buffer
+                self._failed_cache_buffer = collections.OrderedDict()
                 
-                # Limit history size
-                if len(self.sync_history) > self.max_history_size:
-                    self.sync_history = self.sync_history[-self.max_history_size:]
-                    
+            self.cache_manager.prefetch({
+                f"failed_sync_{item_id}": (sync_item, self._failed_cache_ttl)
+                for item_id, sync_item in buffered.items()
+            })
+            
+        except Exception as e:
+            logger.error(f"Error flushing failed sync cache: {str(e)}")
+            
+    def _add_to_history(self, sync_item):
+        """Add sync item in its terminal state to history"""
+        try:
+            # Item is no longer mutated, so store the reference; the bounded
+            # deque append is atomic, no lock needed
+            self.sync_history.append(sync_item)
+            
         except Exception as e:
             logger.error(f"Error adding to sync history: {str(e)}")
             
     def get_sync_status(self):
         """Get current synchronization status"""
-        with self._lock:
-            status = {
-                'is_running': self.is_running,
-                'queue_size': self.sync_queue.qsize(),
-                'failed_syncs_count': len(self.failed_syncs),
-                'history_size': len(self.sync_history),
-                'stats': self._stats.copy()
+        return {
+            'is_running': self.is_running,
+            'queue_size': self._pending_count(),
+            'failed_syncs_count': len(self.failed_syncs),
+            'history_size': len(self.sync_history),
+            'stats': {
+                'successful_syncs': self._successful_syncs.value,
+                'failed_syncs': self._failed_syncs.value,
+                'last_sync_time': self._last_sync_time,
+                'total_items_processed': self._items_processed.value
             }
-            
-            return status
+        }
             
     def retry_failed_syncs(self):
         """Retry all failed syncs"""
@@ -251,9 +479,10 @@ class SyncService:
             self.failed_syncs.clear()
             
             for sync_item in failed_syncs_copy:
-                sync_item['retry_count'] = 0
-                sync_item['status'] = 'queued'
-                self.sync_queue.put((SyncPriority.HIGH.value, sync_item))
+                # Requeue a fresh item; the failed one is already in history
+                self._enqueue(SyncPriority.HIGH, replace(
+                    sync_item, retry_count=0, status='queued',
+                    processing_start=None, processing_end=None, error=None, not_before=0.0))
                 retry_count += 1
                 
             logger.info(f"Retrying {retry_count} failed syncs")
@@ -265,11 +494,10 @@ class SyncService:
             
     def clear_history(self):
         """Clear sync history"""
-        with self._lock:
-            cleared_count = len(self.sync_history)
-            self.sync_history.clear()
-            logger.info(f"Cleared {cleared_count} items from sync history")
-            return cleared_count
+        cleared_count = len(self.sync_history)
+        self.sync_history.clear()
+        logger.info(f"Cleared {cleared_count} items from sync history")
+        return cleared_count
             
     def export_sync_report(self, file_path=None):
         """Export sync report to file"""
@@ -278,14 +506,21 @@ class SyncService:
                 file_path = f"sync_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
                 
             report = {
-                'generated_at': datetime.now().isoformat(),
+                'generated_at': iso_now(),
                 'status': self.get_sync_status(),
-                'recent_history': self.sync_history[-100:],  # Last 100 items
-                'failed_syncs': self.failed_syncs
+                'recent_history': [asdict(sync_item, dict_factory=_report_dict) for sync_item in itertools.islice(  # Last 100 items
+                    self.sync_history, max(0, len(self.sync_history) - 100), None)],
+                'failed_syncs': [asdict(sync_item, dict_factory=_report_dict) for sync_item in self.failed_syncs]
             }
             
-            with open(file_path, 'w') as f:
-                json.dump(report, f, indent=2, default=str)
+            # Both encoders see the same plain values, so the files are identical
+            if ORJSON_AVAILABLE:
+                with open(file_path, 'wb') as f:
+                    f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME,
+                                         default=_report_default))
+            else:
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    json.dump(report, f, indent=2, ensure_ascii=False, default=_report_default)
                 
             logger.info(f"Sync report exported to: {file_path}")
             return True
@@ -303,7 +538,7 @@ class SyncService:
                 'batch_id': batch_id,
                 'operation': operation,
                 'entities': entities_data,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': iso_now()
             }
             
             return self.queue_sync(
@@ -320,11 +555,8 @@ class SyncService:
     def wait_for_sync_completion(self, timeout=30):
         """Wait for all queued syncs to complete (for testing or critical operations)"""
         try:
-            start_time = time.time()
-            while not self.sync_queue.empty() and (time.time() - start_time) < timeout:
-                time.sleep(0.1)
-                
-            return self.sync_queue.empty()
+            with self._cv:
+                return self._cv.wait_for(lambda: not self._any_pending(), timeout=timeout)
             
         except Exception as e:
             logger.error(f"Error waiting for sync completion: {str(e)}")
@@ -0,0 +1,32 @@
+"""
+Shared fixtures for AutoCAD Structural Plugin tests
+"""
+import copy
+import os
+import sys
+
+import pytest
+
+# Plugin modules import each other as top-level packages (utils, services)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.config import config
+
+
+@pytest.fixture
+def plugin_config(tmp_path, monkeypatch):
+    """Config instance backed by a temporary file and cache directory"""
+    monkeypatch.setattr(config, '_config_file', tmp_path / 'plugin_config.json')
+    saved_data = config._config_data
+    
+    with config._lock:
+        config._config_data = copy.deepcopy(saved_data)
+        config._version += 1
+    config.set('cache_dir', str(tmp_path / 'cache'), save=False)
+    
+    yield config
+    
+    config._cancel_flush()
+    with config._lock:
+        config._config_data = saved_data
+        config._version += 1
@@ -0,0 +1,81 @@
+"""
+Tests for the plugin services reading their settings from the config
+"""
+import pytest
+
+pytest.importorskip('requests')  # services.api_client talks HTTP through requests
+
+from services.cache_manager import CacheManager
+from services.license_service import LicenseService
+from services.sync_service import SyncService
+
+
+@pytest.fixture
+def cache_manager(plugin_config):
+    manager = CacheManager()
+    yield manager
+    manager.close()
+
+
+def test_cache_manager_reads_config(plugin_config):
+    plugin_config.set('cache_sweep_interval', 5, save=False)
+    plugin_config.set('cache_stats_approx', False, save=False)
+    
+    manager = CacheManager()
+    try:
+        assert manager._initialized
+        assert manager.sweep_interval == 5
+        assert manager.stats_approx is False
+    finally:
+        manager.close()
+
+
+@pytest.mark.parametrize('interval', [0, -1, None, 'soon'])
+def test_cache_manager_rejects_invalid_sweep_interval(plugin_config, interval):
+    plugin_config.set('cache_sweep_interval', interval, save=False)
+    
+    manager = CacheManager()
+    try:
+        assert manager.sweep_interval == 60
+    finally:
+        manager.close()
+
+
+def test_cache_index_stats_match_sql(cache_manager):
+    cache_manager.set('fresh', {'a': 1}, ttl=3600)
+    cache_manager.set('stale', [1, 2, 3], ttl=-60)
+    cache_manager.set('fresh', {'a': 2}, ttl=3600)
+    assert cache_manager.get('fresh') == {'a': 2}
+    
+    index_stats = cache_manager._index_stats()
+    assert index_stats == cache_manager._collect_persistent_stats()
+    assert index_stats['entries'] == 2
+    assert index_stats['expired_entries'] == 1
+
+
+def test_sync_service_reads_config(plugin_config):
+    plugin_config.set('sync_batch_size', 25, save=False)
+    plugin_config.set('sync_batch_interval_ms', 50, save=False)
+    
+    service = SyncService()
+    try:
+        assert service.batch_size == 25
+        assert service.batch_interval == pytest.approx(0.05)
+        assert service.max_concurrency == 10
+        assert service.retry_delay == service.sync_interval == 10
+    finally:
+        service.cache_manager.close()
+
+
+def test_license_machine_id_is_stable(plugin_config):
+    first = LicenseService()
+    second = LicenseService()
+    try:
+        assert first.machine_id == second.machine_id
+        assert len(first.machine_id) == 32
+        assert plugin_config.get('machine_id') == first.machine_id
+        assert plugin_config.get('machine_id_salt')
+        assert plugin_config._config_file.exists()
+    finally:
+        first.cache_manager.close()
+        second.cache_manager.close()
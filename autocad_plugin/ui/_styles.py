@@ -0,0 +1,29 @@
+"""
+Shared fonts and ttk styles for the plugin UI
+"""
+import tkinter as tk
+from tkinter import ttk
+from tkinter import font as tkfont
+from typing import Dict
+
+# Named fonts, created once a Tk root exists
+FONTS: Dict[str, tkfont.Font] = {}
+
+def init_styles(master: tk.Misc):
+    """Create shared fonts and configure label styles (idempotent)
+
+    Args:
+        master: Any widget belonging to the Tk root the styles apply to
+    """
+    if FONTS:
+        return
+
+    FONTS['title'] = tkfont.Font(master, family='Arial', size=16, weight='bold')
+    FONTS['heading'] = tkfont.Font(master, family='Arial', size=12, weight='bold')
+    FONTS['caption'] = tkfont.Font(master, family='Arial', size=9, slant='italic')
+
+    style = ttk.Style(master)
+    style.configure('Title.TLabel', font=FONTS['title'])
+    style.configure('Heading.TLabel', font=FONTS['heading'])
+    style.configure('Caption.TLabel', font=FONTS['caption'])
+    style.configure('Palette.TFrame', padding=10)
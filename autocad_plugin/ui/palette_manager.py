@@ -2,23 +2,74 @@
 Palette management with tkinter
 """
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk
 import os
-from typing import Dict, Optional
+from functools import partial
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 
 from utils.logger import logger
 from utils.config import Config
+from ._styles import init_styles
+
+# Status messages for palette tools
+_TOOL_ACTIONS: Mapping[str, str] = MappingProxyType({
+    'column': "Creating structural column...",
+    'wall': "Creating structural wall...",
+    'beam': "Creating structural beam...",
+    'slab': "Creating structural slab...",
+    'foundation': "Creating foundation...",
+    'modify': "Modify tool activated - select an element",
+    'delete': "Delete tool activated - select an element to delete"
+})
+
+# Sample layers: (name, count, color)
+_SAMPLE_LAYERS = (
+    ('STRUCTURAL_COLUMNS', '0', 'Red'),
+    ('STRUCTURAL_WALLS', '0', 'Yellow'),
+    ('STRUCTURAL_BEAMS', '0', 'Green'),
+    ('STRUCTURAL_SLABS', '0', 'Cyan'),
+    ('STRUCTURAL_FOUNDATIONS', '0', 'Blue')
+)
+
+# Palette window geometry, applied once after the content is built
+_PALETTE_GEOMETRY = {
+    'properties': "300x400",
+    'tools': "250x300",
+    'layers': "350x200"
+}
 
 class PaletteManager:
     """Manages tkinter windows for the structural plugin"""
     
+    __slots__ = ('master', 'palettes', 'status_text', '_palette_visible',
+                 '_log_buffer', '_log_pending', '_toast_window', '_toast_label',
+                 '_toast_after')
+    
+    # Hidden Tk root shared by every manager created without a master
+    _root: Optional[tk.Tk] = None
+    
     def __init__(self, master=None):
-        self.master = master or tk.Tk()
+        if master is None:
+            if PaletteManager._root is None:
+                PaletteManager._root = tk.Tk()
+                PaletteManager._root.withdraw()
+            master = tk.Toplevel(PaletteManager._root)
+            master.protocol("WM_DELETE_WINDOW", self.destroy)
+            
+        self.master = master
         self.palettes: Dict[str, tk.Toplevel] = {}
+        self._palette_visible: Dict[str, bool] = {}
+        self._log_buffer: List[str] = []
+        self._log_pending = False
+        self._toast_window: Optional[tk.Toplevel] = None
+        self._toast_label: Optional[ttk.Label] = None
+        self._toast_after: Optional[str] = None
         self._setup_main_window()
         
     def _setup_main_window(self):
         """Setup the main application window"""
+        init_styles(self.master)
         self.master.title("AutoCAD Structural Plugin")
         self.master.geometry("400x600")
         self.master.configure(bg='white')
@@ -35,9 +86,9 @@ class PaletteManager:
         # View menu
         view_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="View", menu=view_menu)
-        view_menu.add_command(label="Properties", command=lambda: self.show_palette('properties'))
-        view_menu.add_command(label="Tools", command=lambda: self.show_palette('tools'))
-        view_menu.add_command(label="Layers", command=lambda: self.show_palette('layers'))
+        view_menu.add_command(label="Properties", command=partial(self.show_palette, 'properties'))
+        view_menu.add_command(label="Tools", command=partial(self.show_palette, 'tools'))
+        view_menu.add_command(label="Layers", command=partial(self.show_palette, 'layers'))
         
         # Create main content
         self._create_main_content()
@@ -51,7 +102,7 @@ class PaletteManager:
         title_label = ttk.Label(
             header_frame, 
             text="Structural Plugin", 
-            font=('Arial', 16, 'bold')
+            style='Title.TLabel'
         )
         title_label.pack()
         
@@ -87,34 +138,73 @@ class PaletteManager:
         
     def _log_status(self, message: str):
         """Add message to status window"""
-        self.status_text.insert('end', f"{message}\n")
+        # Buffer messages and write them in one insert once the event loop is idle
+        self._log_buffer.append(f"{message}\n")
+        if not self._log_pending:
+            self._log_pending = True
+            self.master.after_idle(self._flush_log)
+            
+    def _flush_log(self):
+        """Write buffered status messages to the status window"""
+        self.status_text.insert('end', ''.join(self._log_buffer))
         self.status_text.see('end')
+        self._log_buffer.clear()
+        self._log_pending = False
+        
+    def _toast(self, text: str):
+        """Show a short non-modal notification"""
+        if self._toast_window is None:
+            toast = tk.Toplevel(self.master)
+            toast.overrideredirect(True)
+            toast.transient(self.master)
+            self._toast_label = ttk.Label(toast, padding=10)
+            self._toast_label.pack()
+            self._toast_window = toast
+            
+        self._toast_label.config(text=text)
+        self._toast_window.deiconify()
+        self._toast_window.lift()
+        
+        # Restart the hide timer for repeated notifications
+        if self._toast_after is not None:
+            self.master.after_cancel(self._toast_after)
+        self._toast_after = self.master.after(1500, self._hide_toast)
+        
+    def _hide_toast(self):
+        """Hide the notification window"""
+        self._toast_after = None
+        self._toast_window.withdraw()
+        
+    def _create_palette_window(self, name: str, title: str):
+        """Create a palette Toplevel owned by the main window"""
+        palette = tk.Toplevel(self.master)
+        palette.title(title)
+        palette.transient(self.master)
+        # Closing hides the palette so it can be shown again without rebuilding
+        palette.protocol("WM_DELETE_WINDOW", partial(self.hide_palette, name))
+        return palette
         
     def create_properties_palette(self):
         """Create properties palette"""
-        palette = tk.Toplevel(self.master)
-        palette.title("Structural Properties")
-        palette.geometry("300x400")
-        palette.transient(self.master)
+        palette = self._create_palette_window('properties', "Structural Properties")
         
         # Create property palette content
         from .property_palette import PropertyPalette
         property_ui = PropertyPalette(palette)
         property_ui.pack(fill='both', expand=True)
         
+        palette.wm_geometry(_PALETTE_GEOMETRY['properties'])
         self.palettes['properties'] = palette
+        self._palette_visible['properties'] = True
         return True
         
     def create_tool_palette(self):
         """Create tool palette"""
-        palette = tk.Toplevel(self.master)
-        palette.title("Structural Tools")
-        palette.geometry("250x300")
-        palette.transient(self.master)
+        palette = self._create_palette_window('tools', "Structural Tools")
         
         # Tools content
-        tools_frame = ttk.Frame(palette)
-        tools_frame.pack(fill='both', expand=True, padx=10, pady=10)
+        tools_frame = ttk.Frame(palette, style='Palette.TFrame')
+        tools_frame.pack(fill='both', expand=True)
         
         tools = [
             ("Column Tool", "column"),
@@ -130,23 +220,22 @@ class PaletteManager:
             btn = ttk.Button(
                 tools_frame, 
                 text=tool_name,
-                command=lambda tid=tool_id: self._execute_tool(tid)
+                command=partial(self._execute_tool, tool_id)
             )
             btn.pack(fill='x', pady=2)
             
+        palette.wm_geometry(_PALETTE_GEOMETRY['tools'])
         self.palettes['tools'] = palette
+        self._palette_visible['tools'] = True
         return True
         
-    def create_layer_manager_palette(self):
+    def create_layer_manager_palette(self, layers: Optional[Iterable[Tuple[str, str, str]]] = None):
         """Create layer management palette"""
-        palette = tk.Toplevel(self.master)
-        palette.title("Structural Layers")
-        palette.geometry("350x200")
-        palette.transient(self.master)
+        palette = self._create_palette_window('layers', "Structural Layers")
         
         # Layers content
-        layers_frame = ttk.Frame(palette)
-        layers_frame.pack(fill='both', expand=True, padx=10, pady=10)
+        layers_frame = ttk.Frame(palette, style='Palette.TFrame')
+        layers_frame.pack(fill='both', expand=True)
         
         # Layer list
         layer_tree = ttk.Treeview(layers_frame, columns=('Count', 'Color'), show='headings')
@@ -154,17 +243,12 @@ class PaletteManager:
         layer_tree.heading('Count', text='Count')
         layer_tree.heading('Color', text='Color')
         
-        # Sample layers
-        layers = [
-            ('STRUCTURAL_COLUMNS', '0', 'Red'),
-            ('STRUCTURAL_WALLS', '0', 'Yellow'),
-            ('STRUCTURAL_BEAMS', '0', 'Green'),
-            ('STRUCTURAL_SLABS', '0', 'Cyan'),
-            ('STRUCTURAL_FOUNDATIONS', '0', 'Blue')
-        ]
-        
+        if layers is None:
+            layers = _SAMPLE_LAYERS
+            
+        # The tree is filled before it is packed, so it lays out once
         for layer, count, color in layers:
-            layer_tree.insert('', 'end', text=layer, values=(count, color))
+            layer_tree.insert('', 'end', iid=layer, text=layer, values=(count, color))
             
         layer_tree.pack(fill='both', expand=True)
         
@@ -176,7 +260,9 @@ class PaletteManager:
         )
         create_btn.pack(fill='x', pady=5)
         
+        palette.wm_geometry(_PALETTE_GEOMETRY['layers'])
         self.palettes['layers'] = palette
+        self._palette_visible['layers'] = True
         return True
         
     def show_palette(self, name: str):
@@ -186,6 +272,7 @@ class PaletteManager:
             palette.deiconify()  # Show window
             palette.lift()       # Bring to front
             palette.focus_force() # Focus
+            self._palette_visible[name] = True
             return True
         
         # Create palette if it doesn't exist
@@ -195,9 +282,15 @@ class PaletteManager:
             'layers': self.create_layer_manager_palette
         }
         
-        if name in create_methods:
-            if create_methods[name]():
-                return self.show_palette(name)
+        if name in create_methods and create_methods[name]():
+            # Bring the new palette to front
+            palette = self.palettes.get(name)
+            if palette is not None:
+                palette.deiconify()
+                palette.lift()
+                palette.focus_force()
+                self._palette_visible[name] = True
+                return True
                 
         return False
         
@@ -205,18 +298,20 @@ class PaletteManager:
         """Hide a specific palette"""
         if name in self.palettes:
             self.palettes[name].withdraw()
+            self._palette_visible[name] = False
             return True
         return False
         
     def toggle_palette_visibility(self):
         """Toggle visibility of all palettes"""
-        any_visible = any(palette.winfo_viewable() for palette in self.palettes.values())
+        any_visible = any(self._palette_visible.values())
         
-        for palette in self.palettes.values():
+        for name, palette in self.palettes.items():
             if any_visible:
                 palette.withdraw()
             else:
                 palette.deiconify()
+            self._palette_visible[name] = not any_visible
                 
         return not any_visible
         
@@ -225,45 +320,36 @@ class PaletteManager:
         self._log_status(f"Executing tool: {tool_id}")
         
         # Simulate tool execution
-        tool_actions = {
-            'column': "Creating structural column...",
-            'wall': "Creating structural wall...", 
-            'beam': "Creating structural beam...",
-            'slab': "Creating structural slab...",
-            'foundation': "Creating foundation...",
-            'modify': "Modify tool activated - select an element",
-            'delete': "Delete tool activated - select an element to delete"
-        }
-        
-        if tool_id in tool_actions:
-            messagebox.showinfo("Tool Activated", tool_actions[tool_id])
-            self._log_status(tool_actions[tool_id])
+        action = _TOOL_ACTIONS.get(tool_id)
+        if action:
+            self._toast(action)
+            self._log_status(action)
             
     def _create_structural_layers(self):
         """Create structural layers"""
         self._log_status("Creating structural layers...")
-        messagebox.showinfo("Layers Created", "Structural layers created successfully!")
+        self._toast("Structural layers created successfully!")
         self._log_status("✓ Structural layers created")
         
     def _create_column(self):
         self._log_status("Creating column...")
-        messagebox.showinfo("Column", "Column creation tool activated")
+        self._toast("Column creation tool activated")
         
     def _create_wall(self):
         self._log_status("Creating wall...")
-        messagebox.showinfo("Wall", "Wall creation tool activated")
+        self._toast("Wall creation tool activated")
         
     def _create_beam(self):
         self._log_status("Creating beam...") 
-        messagebox.showinfo("Beam", "Beam creation tool activated")
+        self._toast("Beam creation tool activated")
         
     def _create_slab(self):
         self._log_status("Creating slab...")
-        messagebox.showinfo("Slab", "Slab creation tool activated")
+        self._toast("Slab creation tool activated")
         
     def _create_foundation(self):
         self._log_status("Creating foundation...")
-        messagebox.showinfo("Foundation", "Foundation creation tool activated")
+        self._toast("Foundation creation tool activated")
         
     def run(self):
         """Start the tkinter main loop"""
@@ -273,4 +359,9 @@ class PaletteManager:
         """Clean up all windows"""
         for palette in self.palettes.values():
             palette.destroy()
-        self.master.destroy()
\ No newline at end of file
+        self.master.destroy()
+        
+        # Leave the main loop once the last window on the shared root is gone
+        root = PaletteManager._root
+        if root is not None and not root.winfo_children():
+            root.quit()
\ No newline at end of file
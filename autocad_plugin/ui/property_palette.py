@@ -3,7 +3,10 @@ Property palette with tkinter
 """
 import tkinter as tk
 from tkinter import ttk
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+
+from utils.logger import logger
+from ._styles import init_styles
 
 class PropertyPalette(ttk.Frame):
     """Property palette for structural element properties"""
@@ -12,10 +15,17 @@ class PropertyPalette(ttk.Frame):
         super().__init__(master)
         self.current_entity = None
         self.properties: Dict[str, Any] = {}
+        # Property names of the rows currently in the tree
+        self._active_key: Optional[Tuple[str, ...]] = None
+        self._editing_item: Optional[str] = None
+        # Current row values mirrored in Python so saving needs no Tcl calls
+        self._row_values: Dict[str, str] = {}
         self._create_widgets()
         
     def _create_widgets(self):
         """Create property palette widgets"""
+        init_styles(self)
+        
         # Header
         header_frame = ttk.Frame(self)
         header_frame.pack(fill='x', padx=10, pady=10)
@@ -23,14 +33,14 @@ class PropertyPalette(ttk.Frame):
         title_label = ttk.Label(
             header_frame, 
             text="Structural Properties",
-            font=('Arial', 12, 'bold')
+            style='Heading.TLabel'
         )
         title_label.pack()
         
         self.selection_label = ttk.Label(
             header_frame,
             text="No selection",
-            font=('Arial', 9, 'italic')
+            style='Caption.TLabel'
         )
         self.selection_label.pack()
         
@@ -38,22 +48,23 @@ class PropertyPalette(ttk.Frame):
         props_frame = ttk.LabelFrame(self, text="Properties")
         props_frame.pack(fill='both', expand=True, padx=10, pady=5)
         
-        # Create scrollable frame for properties
-        canvas = tk.Canvas(props_frame)
-        scrollbar = ttk.Scrollbar(props_frame, orient='vertical', command=canvas.yview)
-        self.scrollable_frame = ttk.Frame(canvas)
-        
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        # Single Treeview for all properties, edited through one Entry overlay
+        self.tree = ttk.Treeview(props_frame, columns=('value',), show='tree headings')
+        self.tree.heading('#0', text='Property')
+        self.tree.heading('value', text='Value')
+        scrollbar = ttk.Scrollbar(props_frame, orient='vertical', command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
         
-        canvas.pack(side="left", fill="both", expand=True)
+        self.tree.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
+        self._editor_var = tk.StringVar()
+        self._editor = ttk.Entry(self.tree, textvariable=self._editor_var)
+        self._editor.bind('<Return>', self._end_edit)
+        self._editor.bind('<FocusOut>', self._end_edit)
+        self._editor.bind('<Escape>', self._cancel_edit)
+        self.tree.bind('<Double-1>', self._begin_edit)
+        
         # Buttons frame
         buttons_frame = ttk.Frame(self)
         buttons_frame.pack(fill='x', padx=10, pady=5)
@@ -95,54 +106,64 @@ class PropertyPalette(ttk.Frame):
         self.properties = properties
         self.selection_label.config(text=entity_info or "Custom element")
         
-        # Clear existing properties
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-            
-        # Add properties to grid
-        row = 0
-        for prop_name, prop_value in properties.items():
-            # Property name label
-            name_label = ttk.Label(
-                self.scrollable_frame,
-                text=f"{prop_name}:",
-                font=('Arial', 9, 'bold')
-            )
-            name_label.grid(row=row, column=0, sticky='w', padx=5, pady=2)
-            
-            # Property value - use entry for editable fields
-            value_var = tk.StringVar(value=str(prop_value))
-            value_entry = ttk.Entry(
-                self.scrollable_frame,
-                textvariable=value_var,
-                width=20
-            )
-            value_entry.grid(row=row, column=1, sticky='ew', padx=5, pady=2)
-            value_entry.var = value_var
-            value_entry.prop_name = prop_name
+        self._cancel_edit()
+        key = tuple(properties.keys())
+        self._row_values = {prop_name: str(prop_value) for prop_name, prop_value in properties.items()}
+        
+        if key != self._active_key:
+            self.tree.delete(*self.tree.get_children())
+            for prop_name, value in self._row_values.items():
+                self.tree.insert('', 'end', iid=prop_name, text=prop_name, values=(value,))
+            self._active_key = key
+        else:
+            # Same schema: only the values change
+            for prop_name, value in self._row_values.items():
+                self.tree.set(prop_name, 'value', value)
+                
+    def _begin_edit(self, event):
+        """Place the editor over the double-clicked value cell"""
+        item = self.tree.identify_row(event.y)
+        if not item or self.tree.identify_column(event.x) != '#1':
+            return
             
-            row += 1
+        bbox = self.tree.bbox(item, 'value')
+        if not bbox:
+            return
             
-        # Configure grid weights
-        self.scrollable_frame.columnconfigure(1, weight=1)
+        x, y, width, height = bbox
+        self._editing_item = item
+        self._editor_var.set(self._row_values.get(item, ''))
+        self._editor.place(x=x, y=y, width=width, height=height)
+        self._editor.focus_set()
+        self._editor.select_range(0, 'end')
+        
+    def _end_edit(self, event=None):
+        """Write the edited value back to its row"""
+        if self._editing_item is not None:
+            value = self._editor_var.get()
+            self._row_values[self._editing_item] = value
+            self.tree.set(self._editing_item, 'value', value)
+        self._cancel_edit()
+        
+    def _cancel_edit(self, event=None):
+        """Hide the editor without changing the row"""
+        self._editing_item = None
+        self._editor.place_forget()
         
     def refresh_properties(self):
         """Refresh properties from entity"""
         # In real implementation, this would reload from the entity
-        print("Refreshing properties...")
+        logger.debug("Refreshing properties...")
         
     def save_properties(self):
         """Save modified properties"""
-        print("Saving properties...")
+        logger.debug("Saving properties...")
         
         # Collect modified values
-        for child in self.scrollable_frame.winfo_children():
-            if isinstance(child, ttk.Entry) and hasattr(child, 'var'):
-                prop_name = getattr(child, 'prop_name', '')
-                new_value = child.var.get()
-                print(f"Property '{prop_name}' changed to: {new_value}")
+        for prop_name, new_value in self._row_values.items():
+            logger.debug(f"Property '{prop_name}' changed to: {new_value}")
                 
-        print("Properties saved successfully!")
+        logger.debug("Properties saved successfully!")
         
     def clear_selection(self):
         """Clear current selection"""
@@ -150,5 +171,7 @@ class PropertyPalette(ttk.Frame):
         self.selection_label.config(text="No selection")
         
         # Clear property fields
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
\ No newline at end of file
+        self._cancel_edit()
+        self.tree.delete(*self.tree.get_children())
+        self._active_key = None
+        self._row_values = {}
\ No newline at end of file
@@ -4,69 +4,72 @@ Toolbar management with tkinter
 import tkinter as tk
 from tkinter import ttk
 
+from utils.logger import logger
+
+# Toolbar layout: toolbar -> (button text, handler method name)
+_TOOLBAR_SCHEMA = {
+    'structural': (
+        ("Column", '_create_column'),
+        ("Wall", '_create_wall'),
+        ("Beam", '_create_beam'),
+        ("Slab", '_create_slab'),
+        ("Foundation", '_create_foundation')
+    ),
+    'modify': (
+        ("Modify", '_modify_element'),
+        ("Delete", '_delete_element'),
+        ("Properties", '_show_properties')
+    )
+}
+
 class ToolbarManager:
     """Manages toolbars for the structural plugin"""
     
+    __slots__ = ('master', 'toolbars')
+    
     def __init__(self, master=None):
         self.master = master
         self.toolbars = {}
         
     def create_structural_toolbar(self, parent):
         """Create structural elements toolbar"""
-        toolbar = ttk.Frame(parent)
-        
-        buttons = [
-            ("Column", self._create_column),
-            ("Wall", self._create_wall),
-            ("Beam", self._create_beam),
-            ("Slab", self._create_slab),
-            ("Foundation", self._create_foundation)
-        ]
-        
-        for text, command in buttons:
-            btn = ttk.Button(toolbar, text=text, command=command)
-            btn.pack(side='left', padx=2)
-            
-        self.toolbars['structural'] = toolbar
-        return toolbar
+        return self._build_toolbar('structural', parent)
         
     def create_modify_toolbar(self, parent):
         """Create modification toolbar"""
-        toolbar = ttk.Frame(parent)
+        return self._build_toolbar('modify', parent)
         
-        buttons = [
-            ("Modify", self._modify_element),
-            ("Delete", self._delete_element),
-            ("Properties", self._show_properties)
-        ]
+    def _build_toolbar(self, name, parent):
+        """Create a toolbar from its layout schema"""
+        toolbar = ttk.Frame(parent)
         
-        for text, command in buttons:
-            btn = ttk.Button(toolbar, text=text, command=command)
+        for text, handler in _TOOLBAR_SCHEMA[name]:
+            btn = ttk.Button(toolbar, text=text, command=getattr(self, handler))
             btn.pack(side='left', padx=2)
             
-        self.toolbars['modify'] = toolbar
+        self.toolbars[name] = toolbar
         return toolbar
         
     def _create_column(self):
-        print("Column tool activated")
+        logger.debug("Column tool activated")
         
     def _create_wall(self):
-        print("Wall tool activated")
+        logger.debug("Wall tool activated")
         
     def _create_beam(self):
-        print("Beam tool activated")
+        logger.debug("Beam tool activated")
         
     def _create_slab(self):
-        print("Slab tool activated")
+        logger.debug("Slab tool activated")
         
     def _create_foundation(self):
-        print("Foundation tool activated")
+        logger.debug("Foundation tool activated")
         
     def _modify_element(self):
-        print("Modify tool activated")
+        logger.debug("Modify tool activated")
         
     def _delete_element(self):
-        print("Delete tool activated")
+        logger.debug("Delete tool activated")
         
     def _show_properties(self):
-        print("Properties tool activated")
\ No newline at end of file
+        logger.debug("Properties tool activated")
\ No newline at end of file
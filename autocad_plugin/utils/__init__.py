@@ -9,7 +9,8 @@ from .helpers import (
     convert_units,
     generate_id,
     sanitize_filename,
-    format_timestamp
+    format_timestamp,
+    iso_now
 )
 
 __all__ = [
@@ -20,5 +21,6 @@ __all__ = [
     'convert_units',
     'generate_id',
     'sanitize_filename',
-    'format_timestamp'
+    'format_timestamp',
+    'iso_now'
 ]
\ No newline at end of file
@@ -1,22 +1,127 @@
 """
 Configuration management for AutoCAD Structural Plugin
 """
+import atexit
+import copy
+import functools
 import json
 import os
 import shutil
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional
 from datetime import datetime
+from types import MappingProxyType
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from .logger import logger
 
+# Marks a missing key in cached config lookups
+_MISSING = object()
+
+def _freeze(value: Any) -> Any:
+    """Read-only view of nested defaults: dicts become mappingproxies, lists tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+def _thaw(value: Any) -> Any:
+    """Mutable deep copy of a (possibly frozen) config value"""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_thaw(v) for v in value]
+    return copy.deepcopy(value)
+
+# Default configuration values, frozen at every level; _thaw() before mutating
+_DEFAULT_CONFIG = _freeze({
+    'plugin': {
+        'version': '1.0.0',
+        'auto_update_check': True,
+        'check_interval_hours': 24,
+        'backup_enabled': True,
+        'backup_count': 5
+    },
+    'logging': {
+        'level': 'INFO',
+        'max_file_size_mb': 10,
+        'backup_count': 5,
+        'auto_cleanup_days': 30
+    },
+    'ui': {
+        'palette_visible': True,
+        'palette_dock_side': 'left',
+        'palette_width': 300,
+        'palette_opacity': 100,
+        'ribbon_visible': True,
+        'toolbar_visible': False,
+        'theme': 'system'
+    },
+    'sync': {
+        'enabled': True,
+        'interval_seconds': 30,
+        'max_retries': 3,
+        'batch_size': 50,
+        'auto_sync': True
+    },
+    'api': {
+        'base_url': 'https://api.structural.example.com',
+        'timeout_seconds': 30,
+        'retry_count': 3,
+        'cache_enabled': True,
+        'cache_ttl_minutes': 60
+    },
+    'units': {
+        'system': 'metric',
+        'length_unit': 'mm',
+        'force_unit': 'kN',
+        'moment_unit': 'kNm',
+        'stress_unit': 'MPa'
+    },
+    'structural': {
+        'default_material': 'Concrete C30',
+        'default_reinforcement_grade': '500 MPa',
+        'safety_factors': {
+            'concrete': 1.5,
+            'steel': 1.15,
+            'load': 1.35
+        },
+        'auto_calculate': True,
+        'validate_geometry': True
+    },
+    'license': {
+        'key': '',
+        'type': 'trial',
+        'expires_at': None,
+        'features': []
+    }
+})
+
 class Config:
     """Configuration management with persistence and validation"""
     
     _instance = None
     _config_data = {}
     _config_file = None
-    _default_config = {}
+    _default_config = _DEFAULT_CONFIG
+    _last_backup_ts = 0.0
+    _dirty = False
+    _flush_timer = None
+    _lock = threading.RLock()
+    _version = 0
+    
+    # Minimum seconds between automatic backups of the config file
+    BACKUP_INTERVAL = 60
+    # Seconds set() waits before writing, so bursts of updates share one write
+    FLUSH_DELAY = 0.25
     
     def __new__(cls):
         if cls._instance is None:
@@ -26,92 +131,28 @@ class Config:
     def __init__(self):
         if not hasattr(self, '_initialized'):
             self._initialized = True
-            self._load_defaults()
             self._initialize_config()
     
-    def _load_defaults(self):
-        """Load default configuration values"""
-        self._default_config = {
-            'plugin': {
-                'version': '1.0.0',
-                'auto_update_check': True,
-                'check_interval_hours': 24,
-                'backup_enabled': True,
-                'backup_count': 5
-            },
-            'logging': {
-                'level': 'INFO',
-                'max_file_size_mb': 10,
-                'backup_count': 5,
-                'auto_cleanup_days': 30
-            },
-            'ui': {
-                'palette_visible': True,
-                'palette_dock_side': 'left',
-                'palette_width': 300,
-                'palette_opacity': 100,
-                'ribbon_visible': True,
-                'toolbar_visible': False,
-                'theme': 'system'
-            },
-            'sync': {
-                'enabled': True,
-                'interval_seconds': 30,
-                'max_retries': 3,
-                'batch_size': 50,
-                'auto_sync': True
-            },
-            'api': {
-                'base_url': 'https://api.structural.example.com',
-                'timeout_seconds': 30,
-                'retry_count': 3,
-                'cache_enabled': True,
-                'cache_ttl_minutes': 60
-            },
-            'units': {
-                'system': 'metric',
-                'length_unit': 'mm',
-                'force_unit': 'kN',
-                'moment_unit': 'kNm',
-                'stress_unit': 'MPa'
-            },
-            'structural': {
-                'default_material': 'Concrete C30',
-                'default_reinforcement_grade': '500 MPa',
-                'safety_factors': {
-                    'concrete': 1.5,
-                    'steel': 1.15,
-                    'load': 1.35
-                },
-                'auto_calculate': True,
-                'validate_geometry': True
-            },
-            'license': {
-                'key': '',
-                'type': 'trial',
-                'expires_at': None,
-                'features': []
-            }
-        }
-    
     def _initialize_config(self):
         """Initialize configuration system"""
         try:
             # Determine config file location
             self._config_file = self._get_config_file_path()
             
-            # Load existing config or create default
+            # Load existing config or start from defaults; the file is
+            # written on the first change rather than on first run
             if self._config_file.exists():
                 self._load_config()
             else:
-                self._config_data = self._default_config.copy()
-                self._save_config()
+                self._config_data = _thaw(_DEFAULT_CONFIG)
+                self._version += 1
                 
             logger.info("Configuration system initialized")
             
         except Exception as e:
             logger.error(f"Failed to initialize configuration: {e}")
-            self._config_data = self._default_config.copy()
+            self._config_data = _thaw(_DEFAULT_CONFIG)
+            self._version += 1
     
     def _get_config_file_path(self) -> Path:
         """Get configuration file path"""
@@ -130,43 +171,75 @@ class Config:
     def _load_config(self):
         """Load configuration from file"""
         try:
-            with open(self._config_file, 'r', encoding='utf-8') as f:
-                loaded_config = json.load(f)
+            loaded_config = self._read_json(self._config_file)
             
             # Merge with defaults (deep merge)
             self._config_data = self._deep_merge(self._default_config, loaded_config)
+            self._version += 1
             
             logger.debug("Configuration loaded from file")
             
         except Exception as e:
             logger.error(f"Failed to load configuration: {e}")
-            self._config_data = self._default_config.copy()
+            self._config_data = _thaw(_DEFAULT_CONFIG)
+            self._version += 1
+    
+    @staticmethod
+    def _read_json(file_path) -> Any:
+        """Read a JSON file in one binary read and parse the bytes directly"""
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass  # e.g. BOM or non UTF-8 encoding; let the stdlib decide
+        return json.loads(data)
+    
+    @staticmethod
+    def _write_json(file_path, data: Any):
+        """Write data as indented UTF-8 JSON"""
+        if ORJSON_AVAILABLE:
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
     
     def _deep_merge(self, base: Dict, update: Dict) -> Dict:
         """Deep merge two dictionaries"""
-        result = base.copy()
+        # One deep copy up front, then merge in place with an explicit stack
+        result = _thaw(base)
+        stack = [(result, update)]
         
-        for key, value in update.items():
-            if (key in result and 
-                isinstance(result[key], dict) and 
-                isinstance(value, dict)):
-                result[key] = self._deep_merge(result[key], value)
-            else:
-                result[key] = value
-                
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
+                else:
+                    target[key] = value
+                    
         return result
     
-    def _save_config(self):
+    def _save_config(self, backup: bool = False):
         """Save configuration to file"""
         try:
-            # Create backup if file exists
-            if self._config_file.exists():
-                backup_file = self._config_file.with_suffix('.json.backup')
-                shutil.copy2(self._config_file, backup_file)
-            
-            # Save config
-            with open(self._config_file, 'w', encoding='utf-8') as f:
-                json.dump(self._config_data, f, indent=2, ensure_ascii=False)
+            with self._lock:
+                # Back up the existing file on explicit saves, otherwise at most
+                # once per BACKUP_INTERVAL
+                now = time.time()
+                if self._config_file.exists() and (backup or now - self._last_backup_ts >= self.BACKUP_INTERVAL):
+                    backup_file = self._config_file.with_suffix('.json.backup')
+                    shutil.copy2(self._config_file, backup_file)
+                    self._last_backup_ts = now
+                
+                # Write to a temp file and swap it in atomically
+                tmp_file = self._config_file.with_suffix('.json.tmp')
+                self._write_json(tmp_file, self._config_data)
+                os.replace(tmp_file, self._config_file)
             
             logger.debug("Configuration saved to file")
             return True
@@ -178,39 +251,57 @@ class Config:
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value by key (dot notation supported)"""
         try:
-            keys = key.split('.')
-            value = self._config_data
-            
-            for k in keys:
-                if isinstance(value, dict) and k in value:
-                    value = value[k]
-                else:
-                    return default
-            
+            value = self._lookup(key, self._version)
+            if value is _MISSING:
+                return default
+            # Cached containers are shared; callers get their own copy
+            if isinstance(value, (dict, list)):
+                return copy.deepcopy(value)
             return value
             
         except Exception as e:
             logger.debug(f"Error getting config key '{key}': {e}")
             return default
     
+    @functools.lru_cache(maxsize=256)
+    def _lookup(self, key: str, version: int) -> Any:
+        """Resolve a dotted key; version is part of the cache key so any change invalidates it"""
+        value = self._config_data
+        
+        for k in key.split('.'):
+            if isinstance(value, dict) and k in value:
+                value = value[k]
+            else:
+                return _MISSING
+        
+        return value
+    
     def set(self, key: str, value: Any, save: bool = True) -> bool:
-        """Set configuration value (dot notation supported)"""
+        """Set configuration value (dot notation supported)
+        
+        With save=True the file is written FLUSH_DELAY seconds later, so the
+        result only reports the in-memory update; call flush() to write now
+        and get the write result.
+        """
         try:
             keys = key.split('.')
-            config_ref = self._config_data
             
-            # Navigate to the parent of the target key
-            for k in keys[:-1]:
-                if k not in config_ref or not isinstance(config_ref[k], dict):
-                    config_ref[k] = {}
-                config_ref = config_ref[k]
-            
-            # Set the value
-            config_ref[keys[-1]] = value
+            with self._lock:
+                config_ref = self._config_data
+                
+                # Navigate to the parent of the target key
+                for k in keys[:-1]:
+                    if k not in config_ref or not isinstance(config_ref[k], dict):
+                        config_ref[k] = {}
+                    config_ref = config_ref[k]
+                
+                # Set the value
+                config_ref[keys[-1]] = value
+                self._version += 1
             
-            # Save if requested
+            # Schedule a coalesced save if requested
             if save:
-                return self._save_config()
+                self._schedule_flush()
                 
             return True
             
@@ -218,21 +309,57 @@ class Config:
             logger.error(f"Failed to set config key '{key}': {e}")
             return False
     
+    def _schedule_flush(self):
+        """Mark config dirty and (re)start the delayed flush timer"""
+        with self._lock:
+            self._dirty = True
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            self._flush_timer = threading.Timer(self.FLUSH_DELAY, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+    
+    def _cancel_flush(self):
+        """Drop any pending delayed flush"""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._dirty = False
+    
+    def flush(self) -> bool:
+        """Write pending changes from set() immediately; False if the write failed"""
+        with self._lock:
+            if not self._dirty:
+                return True
+            self._cancel_flush()
+            if not self._save_config():
+                # Stay dirty so the next flush (or the one at exit) retries
+                self._dirty = True
+                return False
+            return True
+    
     def save(self) -> bool:
         """Save current configuration to file"""
-        return self._save_config()
+        with self._lock:
+            self._cancel_flush()
+            return self._save_config(backup=True)
     
     def reset(self, section: Optional[str] = None) -> bool:
         """Reset configuration to defaults"""
         try:
             if section:
                 if section in self._default_config:
-                    self._config_data[section] = self._default_config[section].copy()
+                    with self._lock:
+                        self._config_data[section] = _thaw(_DEFAULT_CONFIG[section])
+                        self._version += 1
                 else:
                     logger.warning(f"Section '{section}' not found in defaults")
                     return False
             else:
-                self._config_data = self._default_config.copy()
+                with self._lock:
+                    self._config_data = _thaw(_DEFAULT_CONFIG)
+                    self._version += 1
             
             return self._save_config()
             
@@ -256,8 +383,7 @@ class Config:
                 }
             }
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            self._write_json(file_path, export_data)
             
             logger.info(f"Configuration exported to: {file_path}")
             return True
@@ -273,8 +399,7 @@ class Config:
                 logger.error(f"Import file not found: {file_path}")
                 return False
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                import_data = json.load(f)
+            import_data = self._read_json(file_path)
             
             # Validate import data
             if 'config' not in import_data:
@@ -282,7 +407,9 @@ class Config:
                 return False
             
             # Merge imported config
-            self._config_data = self._deep_merge(self._config_data, import_data['config'])
+            with self._lock:
+                self._config_data = self._deep_merge(self._config_data, import_data['config'])
+                self._version += 1
             
             # Save merged config
             success = self._save_config()
@@ -333,11 +460,18 @@ class Config:
     
     def get_config_info(self) -> Dict[str, Any]:
         """Get configuration metadata and statistics"""
+        stat = None
+        if self._config_file:
+            try:
+                stat = self._config_file.stat()
+            except OSError:
+                pass
+        
         return {
             'config_file': str(self._config_file) if self._config_file else None,
-            'file_exists': self._config_file.exists() if self._config_file else False,
-            'file_size': self._config_file.stat().st_size if self._config_file and self._config_file.exists() else 0,
-            'last_modified': datetime.fromtimestamp(self._config_file.stat().st_mtime).isoformat() if self._config_file and self._config_file.exists() else None,
+            'file_exists': stat is not None,
+            'file_size': stat.st_size if stat else 0,
+            'last_modified': datetime.fromtimestamp(stat.st_mtime).isoformat() if stat else None,
             'validation_issues': self.validate_config(),
             'sections_count': len(self._config_data),
             'plugin_version': self.get('plugin.version')
@@ -347,6 +481,9 @@ class Config:
 # Global config instance
 config = Config()
 
+# Write any pending debounced changes on interpreter exit
+atexit.register(config.flush)
+
 # Convenience functions
 def get_config(key: str, default: Any = None) -> Any:
     return config.get(key, default)
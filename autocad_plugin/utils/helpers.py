@@ -1,21 +1,87 @@
 """
 Helper functions and utilities for AutoCAD Structural Plugin
 """
+import base64
 import math
-import random
-import string
 import os
-import re
+import shutil
+import sys
+import time
 from datetime import datetime
+from functools import lru_cache
 from typing import Union, Tuple, List, Optional
 from pathlib import Path
+from types import MappingProxyType
 
 from .logger import logger
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 # Type aliases
 Point2D = Tuple[float, float]
 Point3D = Tuple[float, float, float]
 
+def _is_array(value) -> bool:
+    """True for NumPy array input; lists stay on the scalar loops, which beat
+    converting them to an array at every polygon size"""
+    return NUMPY_AVAILABLE and isinstance(value, np.ndarray)
+
+# Characters not allowed in file names, each mapped to '_'
+_FN_TRANS = str.maketrans('<>:"/\\|?*', '_________')
+
+# AutoCAD Application class, False if unavailable, None until first import attempt
+_AUTOCAD_APP = None
+
+# Unit factors relative to the base unit of each unit type
+_FACTORS = MappingProxyType({
+    'length': MappingProxyType({
+        'mm': 1.0,
+        'cm': 10.0,
+        'm': 1000.0,
+        'in': 25.4,
+        'ft': 304.8
+    }),
+    'force': MappingProxyType({
+        'N': 1.0,
+        'kN': 1000.0,
+        'lbf': 4.44822,
+        'kip': 4448.22
+    }),
+    'stress': MappingProxyType({
+        'Pa': 1.0,
+        'kPa': 1000.0,
+        'MPa': 1e6,
+        'GPa': 1e9,
+        'psi': 6894.76,
+        'ksi': 6894760.0
+    }),
+    'moment': MappingProxyType({
+        'Nm': 1.0,
+        'kNm': 1000.0,
+        'lb-ft': 1.35582,
+        'kip-ft': 1355.82
+    }),
+})
+
+# (unit_type, from_unit, to_unit) -> multiplier, precomputed from _FACTORS.
+# Names are interned so lookups with literal unit strings match by identity
+_RATIOS = {
+    (sys.intern(unit_type), sys.intern(from_unit), sys.intern(to_unit)): from_factor / to_factor
+    for unit_type, factors in _FACTORS.items()
+    for from_unit, from_factor in factors.items()
+    for to_unit, to_factor in factors.items()
+}
+
+# Binary size units indexed by power of 1024
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# (epoch second, ISO string) of the last iso_now() call
+_ISO_CACHE = (0, '')
+
 def validate_point(point: Union[Point2D, Point3D], 
                   min_x: float = -1e6, max_x: float = 1e6,
                   min_y: float = -1e6, max_y: float = 1e6,
@@ -87,6 +153,68 @@ def calculate_distance(point1: Union[Point2D, Point3D],
         logger.error(f"Error calculating distance: {e}")
         return 0.0
 
+def validate_points(points, 
+                    min_x: float = -1e6, max_x: float = 1e6,
+                    min_y: float = -1e6, max_y: float = 1e6,
+                    min_z: float = -1e6, max_z: float = 1e6) -> List[bool]:
+    """
+    Validate many points at once (vectorized validate_point)
+    
+    Args:
+        points: Sequence or (N, 2|3) array of point coordinates
+        min_x, max_x: X coordinate bounds
+        min_y, max_y: Y coordinate bounds  
+        min_z, max_z: Z coordinate bounds
+        
+    Returns:
+        List[bool]: Validity of each point
+    """
+    if not NUMPY_AVAILABLE:
+        return [validate_point(p, min_x, max_x, min_y, max_y, min_z, max_z) for p in points]
+    
+    try:
+        arr = np.asarray(points, dtype=float)
+        if arr.ndim != 2 or arr.shape[1] not in (2, 3):
+            return [validate_point(p, min_x, max_x, min_y, max_y, min_z, max_z) for p in points]
+        
+        dims = arr.shape[1]
+        mins = np.array((min_x, min_y, min_z)[:dims])
+        maxs = np.array((max_x, max_y, max_z)[:dims])
+        # NaN fails both comparisons and infinity is outside any finite bound
+        return np.all((arr >= mins) & (arr <= maxs) & np.isfinite(arr), axis=1).tolist()
+        
+    except (TypeError, ValueError):
+        return [validate_point(p, min_x, max_x, min_y, max_y, min_z, max_z) for p in points]
+
+def calculate_distances(points1, points2) -> List[float]:
+    """
+    Calculate pairwise distances between two equally long point lists
+    
+    Args:
+        points1: Sequence or (N, 2|3) array of first points
+        points2: Sequence or (N, 2|3) array of second points
+        
+    Returns:
+        List[float]: Distance between each pair
+    """
+    if not NUMPY_AVAILABLE:
+        return [calculate_distance(p1, p2) for p1, p2 in zip(points1, points2)]
+    
+    try:
+        a = np.asarray(points1, dtype=float)
+        b = np.asarray(points2, dtype=float)
+        if a.shape != b.shape or a.ndim != 2 or a.shape[1] not in (2, 3):
+            raise ValueError("Point arrays must both have shape (N, 2) or (N, 3)")
+        
+        delta = b - a
+        if a.shape[1] == 2:
+            return np.hypot(delta[:, 0], delta[:, 1]).tolist()
+        return np.sqrt((delta * delta).sum(axis=1)).tolist()
+        
+    except Exception as e:
+        logger.error(f"Error calculating distances: {e}")
+        return [0.0] * len(points1)
+
 def convert_units(value: float, 
                   from_unit: str, 
                   to_unit: str, 
@@ -107,59 +235,45 @@ def convert_units(value: float,
         if from_unit == to_unit:
             return value
         
-        # Length conversions
-        if unit_type == 'length':
-            conversion_factors = {
-                'mm': 1.0,
-                'cm': 10.0,
-                'm': 1000.0,
-                'in': 25.4,
-                'ft': 304.8
-            }
-        # Force conversions
-        elif unit_type == 'force':
-            conversion_factors = {
-                'N': 1.0,
-                'kN': 1000.0,
-                'lbf': 4.44822,
-                'kip': 4448.22
-            }
-        # Stress conversions
-        elif unit_type == 'stress':
-            conversion_factors = {
-                'Pa': 1.0,
-                'kPa': 1000.0,
-                'MPa': 1e6,
-                'GPa': 1e9,
-                'psi': 6894.76,
-                'ksi': 6894760.0
-            }
-        # Moment conversions
-        elif unit_type == 'moment':
-            conversion_factors = {
-                'Nm': 1.0,
-                'kNm': 1000.0,
-                'lb-ft': 1.35582,
-                'kip-ft': 1355.82
-            }
-        else:
-            logger.warning(f"Unknown unit type: {unit_type}")
-            return value
+        ratio = _RATIOS.get((unit_type, from_unit, to_unit))
+        if ratio is not None:
+            return value * ratio
         
-        if from_unit not in conversion_factors or to_unit not in conversion_factors:
+        if unit_type not in _FACTORS:
+            logger.warning(f"Unknown unit type: {unit_type}")
+        else:
             logger.warning(f"Unknown units: {from_unit} -> {to_unit}")
-            return value
-        
-        # Convert to base unit first, then to target unit
-        value_in_base = value * conversion_factors[from_unit]
-        value_in_target = value_in_base / conversion_factors[to_unit]
-        
-        return value_in_target
+        return value
         
     except Exception as e:
         logger.error(f"Error converting units: {e}")
         return value
 
+def convert_units_array(values, 
+                        from_unit: str, 
+                        to_unit: str, 
+                        unit_type: str = 'length'):
+    """
+    Convert a whole array of values between units with a single multiply
+    
+    Args:
+        values: Sequence or NumPy array of values
+        from_unit: Source unit
+        to_unit: Target unit
+        unit_type: Type of unit (length, force, stress, etc.)
+        
+    Returns:
+        Converted NumPy array (list without NumPy); unconverted on unknown units
+    """
+    ratio = 1.0 if from_unit == to_unit else _RATIOS.get((unit_type, from_unit, to_unit))
+    if ratio is None:
+        logger.warning(f"Unknown units: {from_unit} -> {to_unit} ({unit_type})")
+        ratio = 1.0
+    
+    if NUMPY_AVAILABLE:
+        return np.asarray(values, dtype=float) * ratio
+    return [v * ratio for v in values]
+
 def generate_id(prefix: str = "elem", length: int = 8) -> str:
     """
     Generate a unique ID for structural elements
@@ -172,8 +286,9 @@ def generate_id(prefix: str = "elem", length: int = 8) -> str:
         str: Generated ID
     """
     try:
-        timestamp = datetime.now().strftime("%H%M%S")
-        random_part = ''.join(random.choices(string.ascii_uppercase + string.digits, k=length))
+        timestamp = _strftime_now("%H%M%S")
+        # Base32 of OS randomness: 5 bits per character, uppercase letters and digits
+        random_part = base64.b32encode(os.urandom((length * 5 + 7) // 8)).decode('ascii')[:length]
         return f"{prefix}_{timestamp}_{random_part}"
         
     except Exception as e:
@@ -191,11 +306,8 @@ def sanitize_filename(filename: str) -> str:
         str: Sanitized filename
     """
     try:
-        # Remove invalid characters
-        sanitized = re.sub(r'[<>:"/\\|?*]', '_', filename)
-        
-        # Remove leading/trailing spaces and dots
-        sanitized = sanitized.strip(' .')
+        # Replace invalid characters, then remove leading/trailing spaces and dots
+        sanitized = filename.translate(_FN_TRANS).strip(' .')
         
         # Limit length
         if len(sanitized) > 255:
@@ -222,18 +334,47 @@ def format_timestamp(timestamp: Optional[datetime] = None,
     """
     try:
         if timestamp is None:
+            if '%f' not in format_str:
+                return _strftime_now(format_str)
             timestamp = datetime.now()
         return timestamp.strftime(format_str)
     except Exception as e:
         logger.error(f"Error formatting timestamp: {e}")
         return "unknown_time"
 
+def _strftime_now(format_str: str) -> str:
+    """Format the current local time, reformatting only when the second rolls over"""
+    return _strftime_at(format_str, int(time.time()))
+
+@lru_cache(maxsize=32)
+def _strftime_at(format_str: str, second: int) -> str:
+    """Format an epoch second; bounded, so stale seconds and rare formats age out"""
+    return time.strftime(format_str, time.localtime(second))
+
+def iso_now() -> str:
+    """
+    Get the current local time as an ISO 8601 string with second precision
+    
+    The string is rebuilt only when the second rolls over, so hot paths
+    stamping many payloads per second share one formatted value.
+    
+    Returns:
+        str: Current timestamp (e.g., "2024-01-31T12:34:56")
+    """
+    global _ISO_CACHE
+    now = int(time.time())
+    cached_second, cached_str = _ISO_CACHE
+    if now != cached_second:
+        cached_str = datetime.fromtimestamp(now).isoformat()
+        _ISO_CACHE = (now, cached_str)
+    return cached_str
+
 def calculate_area(points: List[Point2D]) -> float:
     """
     Calculate area of a polygon using shoelace formula
     
     Args:
-        points: List of 2D points forming a closed polygon
+        points: List of 2D points forming a closed polygon, or an (N, 2) array
         
     Returns:
         float: Area of the polygon
@@ -242,17 +383,22 @@ def calculate_area(points: List[Point2D]) -> float:
         if len(points) < 3:
             return 0.0
         
-        # Ensure polygon is closed
-        if points[0] != points[-1]:
-            points = points + [points[0]]
+        if _is_array(points):
+            # Shoelace as two dot products; roll wraps the last edge, and a
+            # repeated closing vertex contributes nothing
+            arr = np.asarray(points, dtype=np.float64)
+            x = arr[:, 0]
+            y = arr[:, 1]
+            return 0.5 * abs(float(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1))))
         
+        # Start from the last vertex so the closing edge is included;
+        # a repeated closing vertex adds a zero term
         area = 0.0
-        n = len(points)
+        x1, y1 = points[-1]
         
-        for i in range(n - 1):
-            x1, y1 = points[i]
-            x2, y2 = points[i + 1]
+        for x2, y2 in points:
             area += (x1 * y2) - (x2 * y1)
+            x1, y1 = x2, y2
         
         return abs(area) / 2.0
         
@@ -324,7 +470,7 @@ def is_point_in_polygon(point: Point2D, polygon: List[Point2D]) -> bool:
     
     Args:
         point: Point to check
-        polygon: List of polygon vertices
+        polygon: List of polygon vertices, or an (N, 2) array
         
     Returns:
         bool: True if point is inside polygon
@@ -334,20 +480,22 @@ def is_point_in_polygon(point: Point2D, polygon: List[Point2D]) -> bool:
             return False
         
         x, y = point
-        inside = False
         
-        # Ensure polygon is closed
-        if polygon[0] != polygon[-1]:
-            polygon = polygon + [polygon[0]]
+        if _is_array(polygon):
+            xi, yi, xj, yj = _polygon_edges(polygon)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                crossings = ((yi > y) != (yj > y)) & (x < (xj - xi) * (y - yi) / (yj - yi) + xi)
+            return bool(np.count_nonzero(crossings) & 1)
         
-        j = len(polygon) - 1
-        for i in range(len(polygon)):
-            xi, yi = polygon[i]
-            xj, yj = polygon[j]
-            
+        inside = False
+        
+        # Start from the last vertex so the closing edge is included;
+        # a repeated closing vertex gives a horizontal edge that never crosses
+        xj, yj = polygon[-1]
+        for xi, yi in polygon:
             if ((yi > y) != (yj > y)) and (x < (xj - xi) * (y - yi) / (yj - yi) + xi):
                 inside = not inside
-            j = i
+            xj, yj = xi, yi
         
         return inside
         
@@ -355,6 +503,45 @@ def is_point_in_polygon(point: Point2D, polygon: List[Point2D]) -> bool:
         logger.error(f"Error checking point in polygon: {e}")
         return False
 
+def batch_points_in_polygon(points: List[Point2D], polygon: List[Point2D]) -> List[bool]:
+    """
+    Check many points against one polygon using ray casting
+    
+    Args:
+        points: Points to check
+        polygon: List of polygon vertices
+        
+    Returns:
+        List[bool]: True for each point inside the polygon
+    """
+    try:
+        if len(polygon) < 3:
+            return [False] * len(points)
+        
+        if not NUMPY_AVAILABLE or not points:
+            return [is_point_in_polygon(point, polygon) for point in points]
+        
+        pts = np.asarray(points, dtype=np.float64)
+        
+        # Broadcast points (M, 1) against edges (N,) and reduce per point
+        xi, yi, xj, yj = _polygon_edges(polygon)
+        x = pts[:, 0:1]
+        y = pts[:, 1:2]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            crossings = ((yi > y) != (yj > y)) & (x < (xj - xi) * (y - yi) / (yj - yi) + xi)
+        return (np.count_nonzero(crossings, axis=1) & 1).astype(bool).tolist()
+        
+    except Exception as e:
+        logger.error(f"Error checking points in polygon: {e}")
+        return [False] * len(points)
+
+def _polygon_edges(polygon: List[Point2D]):
+    """Edge start/end coordinate arrays; np.roll closes the polygon"""
+    poly = np.asarray(polygon, dtype=np.float64)
+    xi = poly[:, 0]
+    yi = poly[:, 1]
+    return xi, yi, np.roll(xi, 1), np.roll(yi, 1)
+
 def format_number(value: float, decimals: int = 2, unit: str = "") -> str:
     """
     Format number with specified decimals and unit
@@ -397,12 +584,9 @@ def get_file_size(file_path: str) -> str:
     try:
         size_bytes = os.path.getsize(file_path)
         
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024.0
-        
-        return f"{size_bytes:.2f} TB"
+        # Each unit step is 10 bits, so the bit length picks the unit directly
+        unit_idx = min((size_bytes.bit_length() - 1) // 10, 4) if size_bytes else 0
+        return f"{size_bytes / (1 << (10 * unit_idx)):.2f} {_SIZE_UNITS[unit_idx]}"
         
     except Exception as e:
         logger.error(f"Error getting file size: {e}")
@@ -429,12 +613,11 @@ def create_backup(file_path: str, backup_dir: Optional[str] = None) -> bool:
         
         os.makedirs(backup_dir, exist_ok=True)
         
-        filename = os.path.basename(file_path)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_name = f"{os.path.splitext(filename)[0]}_backup_{timestamp}{os.path.splitext(filename)[1]}"
+        stem, ext = os.path.splitext(os.path.basename(file_path))
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        backup_name = f"{stem}_backup_{timestamp}{ext}"
         backup_path = os.path.join(backup_dir, backup_name)
         
-        import shutil
         shutil.copy2(file_path, backup_path)
         
         logger.info(f"Backup created: {backup_path}")
@@ -444,6 +627,7 @@ def create_backup(file_path: str, backup_dir: Optional[str] = None) -> bool:
         logger.error(f"Error creating backup: {e}")
         return False
 
+@lru_cache(maxsize=256)
 def parse_version(version_string: str) -> Tuple[int, int, int]:
     """
     Parse version string into major, minor, patch tuple
@@ -479,12 +663,7 @@ def compare_versions(version1: str, version2: str) -> int:
         v1 = parse_version(version1)
         v2 = parse_version(version2)
         
-        if v1 < v2:
-            return -1
-        elif v1 > v2:
-            return 1
-        else:
-            return 0
+        return (v1 > v2) - (v1 < v2)
             
     except Exception as e:
         logger.error(f"Error comparing versions: {e}")
@@ -510,10 +689,21 @@ def is_autocad_running() -> bool:
     Returns:
         bool: True if AutoCAD is running
     """
+    global _AUTOCAD_APP
+    if _AUTOCAD_APP is None:
+        # Import the .NET bridge once; later calls reuse the cached result
+        try:
+            import clr
+            from Autodesk.AutoCAD.ApplicationServices import Application
+            _AUTOCAD_APP = Application
+        except Exception:
+            _AUTOCAD_APP = False
+    
+    if not _AUTOCAD_APP:
+        return False
+    
     try:
-        import clr
-        from Autodesk.AutoCAD.ApplicationServices import Application
-        return Application.DocumentManager.MdiActiveDocument is not None
+        return _AUTOCAD_APP.DocumentManager.MdiActiveDocument is not None
     except Exception:
         return False
 
@@ -527,10 +717,9 @@ def measure_execution_time(func):
             ...
     """
     def wrapper(*args, **kwargs):
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        end_time = datetime.now()
-        duration_ms = (end_time - start_time).total_seconds() * 1000
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
         
         logger.log_performance(func.__name__, duration_ms, {
             'args_count': len(args),
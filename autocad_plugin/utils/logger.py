@@ -1,14 +1,23 @@
 """
 Advanced logging utility for AutoCAD Structural Plugin
 """
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 import sys
-import inspect
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 
+# Frames from the stdlib logging call back to the plugin code: _log, the
+# Logger method (or module-level function) that called it, then its caller
+_CALLER_STACKLEVEL = 3
+# Same for methods that call the stdlib logger directly
+_DIRECT_CALLER_STACKLEVEL = 2
+
 class Logger:
     """Advanced logger with AutoCAD integration and multiple handlers"""
     
@@ -25,6 +34,10 @@ class Logger:
             self.logger = None
             self.log_level = logging.INFO
             self.log_file = None
+            self._log_dir = self._get_log_directory()
+            self._handlers = []
+            self._file_handler = None
+            self._listener = None
             self._initialize_logger()
             self._initialized = True
     
@@ -41,7 +54,7 @@ class Logger:
                 self.logger.removeHandler(handler)
             
             # Create logs directory
-            log_dir = self._get_log_directory()
+            log_dir = self._log_dir
             log_dir.mkdir(parents=True, exist_ok=True)
             
             # Set log file path
@@ -57,8 +70,8 @@ class Logger:
                 '%(levelname)-8s | %(message)s'
             )
             
-            # File handler (detailed)
-            file_handler = logging.handlers.RotatingFileHandler(
+            # File handler (detailed, buffered)
+            file_handler = BufferedRotatingFileHandler(
                 self.log_file,
                 maxBytes=10*1024*1024,  # 10MB
                 backupCount=5,
@@ -66,20 +79,32 @@ class Logger:
             )
             file_handler.setLevel(logging.DEBUG)
             file_handler.setFormatter(detailed_formatter)
-            self.logger.addHandler(file_handler)
             
             # Console handler (simple)
             console_handler = logging.StreamHandler(sys.stdout)
             console_handler.setLevel(logging.INFO)
             console_handler.setFormatter(simple_formatter)
-            self.logger.addHandler(console_handler)
             
-            # AutoCAD command line handler (minimal)
+            # File and console output is written by a background listener so
+            # callers only enqueue records
+            log_queue = queue.Queue(-1)
+            self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+            self._listener = logging.handlers.QueueListener(
+                log_queue, file_handler, console_handler, respect_handler_level=True
+            )
+            self._listener.start()
+            atexit.register(self._listener.stop)
+            
+            # AutoCAD command line handler (minimal); stays synchronous since
+            # the AutoCAD API must be called from the caller's thread
             autocad_handler = AutoCADHandler()
             autocad_handler.setLevel(logging.WARNING)
             autocad_handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
             self.logger.addHandler(autocad_handler)
             
+            self._file_handler = file_handler
+            self._handlers = [file_handler, console_handler, autocad_handler]
+            
             self.info("Logger initialized successfully")
             
         except Exception as e:
@@ -110,7 +135,7 @@ class Logger:
         if level.upper() in level_map:
             self.log_level = level_map[level.upper()]
             self.logger.setLevel(self.log_level)
-            for handler in self.logger.handlers:
+            for handler in self._handlers:
                 handler.setLevel(self.log_level)
     
     def debug(self, message, extra_data=None):
@@ -133,33 +158,25 @@ class Logger:
         """Log critical message"""
         self._log(logging.CRITICAL, message, extra_data)
     
-    def _log(self, level, message, extra_data=None):
-        """Internal logging method with caller information"""
+    def _log(self, level, message, extra_data=None, stacklevel=_CALLER_STACKLEVEL):
+        """Internal logging method with caller information
+        
+        Must be called directly from the public entry point, so the record
+        reports that entry point's caller.
+        """
+        # Filtered levels return before any frame walk or formatting
+        if level < self.log_level:
+            return
+        
         try:
-            # Get caller information
-            frame = inspect.currentframe().f_back.f_back
-            caller_info = inspect.getframeinfo(frame)
-            
-            # Prepare log record
-            log_record = {
-                'filename': os.path.basename(caller_info.filename),
-                'lineno': caller_info.lineno,
-                'function': caller_info.function
-            }
-            
-            # Add extra data if provided
-            if extra_data:
-                if isinstance(extra_data, dict):
-                    log_record.update(extra_data)
-                else:
-                    log_record['extra_data'] = str(extra_data)
-            
             # Format message with extra data
-            formatted_message = str(message)
             if extra_data:
-                formatted_message += f" | {extra_data}"
+                formatted_message = f"{message} | {extra_data}"
+            else:
+                formatted_message = str(message)
             
-            self.logger.log(level, formatted_message, extra=log_record)
+            # logging's own findCaller fills in the caller of debug()/info()/...
+            self.logger.log(level, formatted_message, stacklevel=stacklevel)
             
         except Exception as e:
             # Fallback logging if main logger fails
@@ -167,41 +184,55 @@ class Logger:
     
     def log_command(self, command_name, parameters=None, success=True):
         """Log command execution"""
+        level = logging.INFO if success else logging.ERROR
+        if level < self.log_level:
+            return
+        
+        from .helpers import iso_now  # helpers imports this module
+        
         command_data = {
             'command': command_name,
             'parameters': parameters or {},
             'success': success,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': iso_now()
         }
         
-        level = logging.INFO if success else logging.ERROR
         self._log(level, f"Command executed: {command_name}", command_data)
     
     def log_entity_operation(self, operation, entity_type, entity_id, details=None):
         """Log entity operations"""
+        if logging.INFO < self.log_level:
+            return
+        
+        from .helpers import iso_now  # helpers imports this module
+        
         operation_data = {
             'operation': operation,
             'entity_type': entity_type,
             'entity_id': entity_id,
             'details': details or {},
-            'timestamp': datetime.now().isoformat()
+            'timestamp': iso_now()
         }
         
-        self.info(f"Entity {operation}: {entity_type} ({entity_id})", operation_data)
+        self._log(logging.INFO, f"Entity {operation}: {entity_type} ({entity_id})", operation_data)
     
     def log_performance(self, operation, duration_ms, details=None):
         """Log performance metrics"""
-        performance_data = {
-            'operation': operation,
-            'duration_ms': duration_ms,
-            'details': details or {},
-            'timestamp': datetime.now().isoformat()
-        }
+        level = logging.WARNING if duration_ms > 1000 else logging.DEBUG
+        if level < self.log_level:
+            return
         
-        if duration_ms > 1000:
-            self.warning(f"Slow operation: {operation} took {duration_ms}ms", performance_data)
-        else:
-            self.debug(f"Performance: {operation} took {duration_ms}ms", performance_data)
+        try:
+            # One direct call; %-style arguments are only formatted when emitted
+            label = "Slow operation" if level == logging.WARNING else "Performance"
+            if details:
+                self.logger.log(level, "%s: %s took %sms | %s", label, operation, duration_ms, details,
+                                stacklevel=_DIRECT_CALLER_STACKLEVEL)
+            else:
+                self.logger.log(level, "%s: %s took %sms", label, operation, duration_ms,
+                                stacklevel=_DIRECT_CALLER_STACKLEVEL)
+        except Exception as e:
+            print(f"LOG[{level}]: {operation} took {duration_ms}ms | Error: {e}")
     
     def get_log_file_path(self):
         """Get current log file path"""
@@ -217,7 +248,9 @@ class Logger:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 target_path = Path.home() / "Desktop" / f"plugin_logs_export_{timestamp}.log"
             
-            # Copy current log file
+            # Write out buffered records, then copy current log file
+            if self._file_handler:
+                self._file_handler.flush_buffer()
             import shutil
             shutil.copy2(self.log_file, target_path)
             
@@ -228,16 +261,21 @@ class Logger:
             self.error(f"Failed to export logs: {e}")
             return False
     
+    def _scan_log_files(self):
+        """(DirEntry, stat) for each log file, from a single directory scan"""
+        with os.scandir(self._log_dir) as entries:
+            return [(entry, entry.stat()) for entry in entries
+                    if entry.name.endswith('.log') and entry.is_file()]
+    
     def clear_old_logs(self, days_to_keep=30):
         """Clear log files older than specified days"""
         try:
-            log_dir = self._get_log_directory()
-            cutoff_time = datetime.now().timestamp() - (days_to_keep * 24 * 60 * 60)
+            cutoff_time = time.time() - (days_to_keep * 24 * 60 * 60)
             
             deleted_count = 0
-            for log_file in log_dir.glob("*.log"):
-                if log_file.stat().st_mtime < cutoff_time:
-                    log_file.unlink()
+            for entry, stat in self._scan_log_files():
+                if stat.st_mtime < cutoff_time:
+                    os.unlink(entry.path)
                     deleted_count += 1
             
             if deleted_count > 0:
@@ -252,14 +290,13 @@ class Logger:
     def get_log_stats(self):
         """Get logging statistics"""
         try:
-            log_dir = self._get_log_directory()
-            log_files = list(log_dir.glob("*.log"))
+            stats = [stat for _, stat in self._scan_log_files()]
             
-            total_size = sum(f.stat().st_size for f in log_files)
-            oldest_log = min((f.stat().st_mtime for f in log_files), default=0)
+            total_size = sum(stat.st_size for stat in stats)
+            oldest_log = min((stat.st_mtime for stat in stats), default=0)
             
             return {
-                'total_log_files': len(log_files),
+                'total_log_files': len(stats),
                 'total_size_bytes': total_size,
                 'current_log_file': self.get_log_file_path(),
                 'oldest_log_timestamp': datetime.fromtimestamp(oldest_log).isoformat() if oldest_log > 0 else None,
@@ -271,25 +308,122 @@ class Logger:
             return {}
 
 
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that writes through a large buffer
+    
+    Records are flushed to disk at most FLUSH_INTERVAL seconds after they are
+    written, immediately for ERROR and above, and when the handler closes.
+    The rollover check uses a running size count instead of seeking the
+    stream, and the message it formats is reused for the write.
+    """
+    
+    BUFFER_SIZE = 64 * 1024
+    FLUSH_INTERVAL = 1.0
+    
+    def __init__(self, *args, **kwargs):
+        self._flush_timer = None
+        self._closing = False
+        self._is_real_file = True
+        self._size = 0
+        self._pending = None
+        super().__init__(*args, **kwargs)
+    
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, buffering=self.BUFFER_SIZE, encoding=self.encoding)
+        # Checked once per open; rotating e.g. os.devnull is pointless
+        self._is_real_file = os.path.isfile(self.baseFilename)
+        self._size = stream.tell()
+        return stream
+    
+    def shouldRollover(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes <= 0 or not self._is_real_file:
+            return False
+        
+        msg = self.format(record)
+        self._pending = (record, msg)
+        return self._size + len(msg) + 1 >= self.maxBytes
+    
+    def format(self, record):
+        pending = self._pending
+        if pending is not None and pending[0] is record:
+            return pending[1]
+        return super().format(record)
+    
+    def emit(self, record):
+        try:
+            super().emit(record)
+            if self._pending is not None:
+                self._size += len(self._pending[1]) + 1
+        finally:
+            self._pending = None
+        
+        if record.levelno >= logging.ERROR:
+            self.flush_buffer()
+    
+    def flush(self):
+        """Defer the flush to the timer instead of flushing every record"""
+        if self._flush_timer is None and self.stream and not self._closing:
+            self._flush_timer = threading.Timer(self.FLUSH_INTERVAL, self.flush_buffer)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+    
+    def flush_buffer(self):
+        """Write buffered records to disk now"""
+        self.acquire()
+        try:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self.stream and hasattr(self.stream, 'flush'):
+                self.stream.flush()
+        finally:
+            self.release()
+    
+    def close(self):
+        self._closing = True
+        self.flush_buffer()
+        super().close()
+
+
 class AutoCADHandler(logging.Handler):
     """Custom handler for AutoCAD command line output"""
     
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        self._application = None  # False once the AutoCAD .NET API failed to import
+        self._document = None
+        self._editor = None
+    
+    def _get_editor(self):
+        """Editor of the active document, cached until the active document changes"""
+        if self._application is None:
+            try:
+                # Try to import AutoCAD .NET API (once)
+                import clr
+                from Autodesk.AutoCAD.ApplicationServices import Application
+                self._application = Application
+            except Exception:
+                self._application = False
+        
+        if not self._application:
+            raise RuntimeError("AutoCAD .NET API not available")
+        
+        doc = self._application.DocumentManager.MdiActiveDocument
+        if not doc:
+            return None
+        if self._editor is None or doc != self._document:
+            self._document = doc
+            self._editor = doc.Editor
+        return self._editor
+    
     def emit(self, record):
         try:
-            # Try to import AutoCAD .NET API
-            import clr
-            from Autodesk.AutoCAD.ApplicationServices import Application
-            
-            message = self.format(record)
-            
             # Send to AutoCAD command line
-            doc = Application.DocumentManager.MdiActiveDocument
-            if doc:
-                editor = doc.Editor
-                if record.levelno >= logging.ERROR:
-                    editor.WriteMessage(f"\n{message}\n")
-                elif record.levelno >= logging.WARNING:
-                    editor.WriteMessage(f"\n{message}\n")
+            editor = self._get_editor()
+            if editor and record.levelno >= logging.WARNING:
+                editor.WriteMessage(f"\n{self.format(record)}\n")
                     
         except Exception:
             # Fallback to console if AutoCAD not available
@@ -301,16 +435,16 @@ logger = Logger()
 
 # Convenience functions
 def debug(message, extra_data=None):
-    logger.debug(message, extra_data)
+    logger._log(logging.DEBUG, message, extra_data)
 
 def info(message, extra_data=None):
-    logger.info(message, extra_data)
+    logger._log(logging.INFO, message, extra_data)
 
 def warning(message, extra_data=None):
-    logger.warning(message, extra_data)
+    logger._log(logging.WARNING, message, extra_data)
 
 def error(message, extra_data=None):
-    logger.error(message, extra_data)
+    logger._log(logging.ERROR, message, extra_data)
 
 def critical(message, extra_data=None):
-    logger.critical(message, extra_data)
\ No newline at end of file
+    logger._log(logging.CRITICAL, message, extra_data)
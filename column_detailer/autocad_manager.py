@@ -3,7 +3,9 @@ AutoCAD connection and document management
 """
 
 import win32com.client
+import win32com.client.gencache
 import pythoncom
+import numpy as np
 from typing import Optional, List, Dict, Any
 import logging
 
@@ -17,14 +19,24 @@ class AutoCADManager:
         self.model_space = None
         self.paper_space = None
         self._connected = False
+        # Names known to exist in the document; saves a COM call per entry on lookups
+        self._layer_cache = set()
+        self._linetype_cache = set()
         
     def connect(self) -> bool:
         """Connect to running AutoCAD instance"""
         try:
-            self.acad_app = win32com.client.Dispatch("AutoCAD.Application")
+            try:
+                # Early binding: generated wrappers call by DISPID without a name lookup
+                self.acad_app = win32com.client.gencache.EnsureDispatch("AutoCAD.Application")
+            except Exception as e:
+                self.logger.debug(f"Early binding unavailable, using late binding: {e}")
+                self.acad_app = win32com.client.Dispatch("AutoCAD.Application")
             self.doc = self.acad_app.ActiveDocument
             self.model_space = self.doc.ModelSpace
             self.paper_space = self.doc.PaperSpace
+            self._layer_cache = {layer.Name for layer in self.doc.Layers}
+            self._linetype_cache = {lt.Name for lt in self.doc.Linetypes}
             self._connected = True
             
             self.logger.info("Successfully connected to AutoCAD")
@@ -44,13 +56,12 @@ class AutoCADManager:
     def create_layer(self, layer_name: str, color: int = 256) -> bool:
         """Create a layer if it doesn't exist"""
         try:
-            layers = self.doc.Layers
-            for layer in layers:
-                if layer.Name == layer_name:
-                    return True
+            if layer_name in self._layer_cache:
+                return True
             
-            new_layer = layers.Add(layer_name)
+            new_layer = self.doc.Layers.Add(layer_name)
             new_layer.Color = color
+            self._layer_cache.add(layer_name)
             return True
             
         except Exception as e:
@@ -63,25 +74,78 @@ class AutoCADManager:
             self.doc.ActiveLayer = self.doc.Layers.Item(layer_name)
             return True
         except Exception as e:
+            # The layer may have been removed in AutoCAD since it was cached
+            self._layer_cache.discard(layer_name)
             self.logger.error(f"Failed to set current layer to {layer_name}: {e}")
             return False
     
     def get_linetype(self, linetype_name: str) -> bool:
         """Load linetype if not present"""
         try:
-            linetypes = self.doc.Linetypes
-            for lt in linetypes:
-                if lt.Name == linetype_name:
-                    return True
+            if linetype_name in self._linetype_cache:
+                return True
             
             # Load from ACAD.lin
-            linetypes.Load(linetype_name, "acad.lin")
+            self.doc.Linetypes.Load(linetype_name, "acad.lin")
+            self._linetype_cache.add(linetype_name)
             return True
             
         except Exception as e:
             self.logger.warning(f"Failed to load linetype {linetype_name}: {e}")
             return False
     
+    def add_lines(self, segments) -> List[Any]:
+        """Add many line segments to model space
+        
+        ModelSpace has no batch AddLine, and each bar or stirrup must stay its
+        own Line entity, so this is one COM call per segment.
+        
+        Args:
+            segments: (N, 6) array-like of (x1, y1, z1, x2, y2, z2) rows
+            
+        Returns:
+            The created line objects
+        """
+        coords = np.asarray(segments, dtype=np.float64).reshape(-1, 6)
+        # Resolve the COM method once instead of per segment
+        add_line = self.model_space.AddLine
+        return [add_line(point(x1, y1, z1), point(x2, y2, z2))
+                for x1, y1, z1, x2, y2, z2 in coords.tolist()]
+    
+    def add_texts(self, labels: List[str], positions, height: float) -> List[Any]:
+        """Add many single-line texts to model space
+        
+        Args:
+            labels: Text string for each entry
+            positions: (N, 2) array-like of (x, y) insertion points
+            height: Text height shared by all entries
+            
+        Returns:
+            The created text objects
+        """
+        coords = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        # Resolve the COM method once instead of per text
+        add_text = self.model_space.AddText
+        return [add_text(label, point(x, y), height)
+                for label, (x, y) in zip(labels, coords.tolist())]
+    
+    def add_polyline(self, points, closed: bool = False):
+        """Add a lightweight polyline through 2D points in a single COM call
+        
+        Args:
+            points: (N, 2) array-like of (x, y) vertices
+            closed: Close the polyline back to its first vertex
+            
+        Returns:
+            The created polyline object
+        """
+        coords = np.asarray(points, dtype=np.float64).ravel()
+        vertices = win32com.client.VARIANT(pythoncom.VT_ARRAY | pythoncom.VT_R8, coords.tolist())
+        polyline = self.model_space.AddLightWeightPolyline(vertices)
+        if closed:
+            polyline.Closed = True
+        return polyline
+    
     def zoom_extents(self):
         """Zoom to extents"""
         try:
@@ -96,6 +160,14 @@ class AutoCADManager:
         except Exception as e:
             self.logger.warning(f"Failed to refresh view: {e}")
 
+def point(x: float, y: float, z: float = 0.0) -> win32com.client.VARIANT:
+    """3D point as a typed double-array VARIANT
+    
+    pywin32 passes a pre-typed VARIANT through unchanged instead of probing a
+    tuple's elements to guess the array type on every COM call.
+    """
+    return win32com.client.VARIANT(pythoncom.VT_ARRAY | pythoncom.VT_R8, (x, y, z))
+
 class DrawingContext:
     """Context manager for AutoCAD drawing operations"""
     
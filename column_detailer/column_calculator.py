@@ -3,53 +3,98 @@ Column geometry and reinforcement calculations
 """
 
 import math
+import numpy as np
+from functools import lru_cache
 from typing import List, Tuple, Dict, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, astuple
 from .excel_reader import FloorData, ColumnSettings
+from .entities.rebar import stirrup_zones
 
 @dataclass
 class ColumnGeometry:
     """Calculated column geometry"""
     base_point: Tuple[float, float, float]
     total_height: float
-    floor_heights: List[float]
-    floor_levels: List[float]
-    column_boundaries: List[Tuple[float, float]]  # (left_x, right_x) for each floor
+    floor_heights: np.ndarray
+    floor_levels: np.ndarray  # base level followed by the top of each floor
+    column_boundaries: np.ndarray  # (N, 2) rows of (left_x, right_x) for each floor
+
+# Stirrup spacing types, stored in layouts by index
+SPACING_TYPES = ('edge', 'mid')
+EDGE_SPACING, MID_SPACING = 0, 1
+
+# One record per stirrup; a structured array keeps the fields unboxed
+STIRRUP_DTYPE = np.dtype([('y', np.float64), ('spacing_type', np.int8), ('diameter', np.float64)])
 
 @dataclass
 class RebarLayout:
     """Rebar layout calculations"""
-    main_bars: List[Tuple[float, float, float, float]]  # (x, start_y, end_y, diameter)
-    stirrup_positions: List[Tuple[float, float, float]]  # (y, spacing_type, diameter)
+    main_bars: np.ndarray  # (N, 4) rows of (x, start_y, end_y, diameter)
+    stirrup_positions: np.ndarray  # STIRRUP_DTYPE records of (y, spacing_type, diameter)
     lap_lengths: List[Tuple[float, float, float]]  # (y_position, length, diameter)
 
+# Number of results kept per cache in ColumnCalculator
+RESULT_CACHE_SIZE = 128
+
+def _floors_signature(floors: List[FloorData]) -> tuple:
+    """Hashable snapshot of the floor values; changes whenever a floor is edited"""
+    return tuple(astuple(floor) for floor in floors)
+
+def _freeze(*arrays: np.ndarray):
+    """Mark cached result arrays read-only so callers cannot alter shared state"""
+    for array in arrays:
+        array.flags.writeable = False
+
 class ColumnCalculator:
-    """Performs calculations for column detailing"""
+    """Performs calculations for column detailing
+    
+    Geometry and rebar layouts are memoized on the input values, so redrawing
+    the same column (or another view of it) reuses the previous result.
+    Cached results are shared and their arrays are read-only.
+    """
     
     def __init__(self):
         self.rebar_clearance = 25.0  # mm clearance for rebars
+        self._geometry_cache: Dict[tuple, ColumnGeometry] = {}
+        self._layout_cache: Dict[tuple, RebarLayout] = {}
+    
+    def clear_cache(self):
+        """Drop all memoized results"""
+        self._geometry_cache.clear()
+        self._layout_cache.clear()
+    
+    def _remember(self, cache: Dict[tuple, Any], key: tuple, value: Any) -> Any:
+        """Store a result, evicting the oldest entry when the cache is full"""
+        if len(cache) >= RESULT_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = value
+        return value
     
     def calculate_column_geometry(self, floors: List[FloorData], settings: ColumnSettings,
                                 base_point: Tuple[float, float, float]) -> ColumnGeometry:
         """Calculate complete column geometry"""
+        key = (_floors_signature(floors), tuple(base_point))
+        geometry = self._geometry_cache.get(key)
+        if geometry is None:
+            geometry = self._remember(self._geometry_cache, key,
+                                      self._compute_column_geometry(floors, tuple(base_point)))
+        return geometry
+    
+    def _compute_column_geometry(self, floors: List[FloorData],
+                                 base_point: Tuple[float, float, float]) -> ColumnGeometry:
+        """Compute column geometry from scratch"""
         base_x, base_y, base_z = base_point
         
-        floor_heights = [floor.total_height for floor in floors]
-        total_height = sum(floor_heights)
+        floor_heights = np.fromiter((floor.total_height for floor in floors), float, count=len(floors))
+        total_height = float(floor_heights.sum())
         
         # Calculate floor levels
-        floor_levels = [base_y]
-        current_height = base_y
-        for height in floor_heights:
-            current_height += height
-            floor_levels.append(current_height)
+        floor_levels = np.concatenate(([base_y], base_y + np.cumsum(floor_heights)))
         
         # Calculate column boundaries for each floor
-        column_boundaries = []
-        for i, floor in enumerate(floors):
-            left_x = base_x - floor.column_length / 2
-            right_x = base_x + floor.column_length / 2
-            column_boundaries.append((left_x, right_x))
+        half_lengths = np.fromiter((floor.column_length for floor in floors), float, count=len(floors)) / 2
+        column_boundaries = np.column_stack((base_x - half_lengths, base_x + half_lengths))
+        _freeze(floor_heights, floor_levels, column_boundaries)
         
         return ColumnGeometry(
             base_point=base_point,
@@ -62,6 +107,17 @@ class ColumnCalculator:
     def calculate_rebar_layout(self, floors: List[FloorData], geometry: ColumnGeometry,
                              settings: ColumnSettings) -> RebarLayout:
         """Calculate rebar and stirrup layout"""
+        key = (_floors_signature(floors), settings.concrete_cover, settings.beam_depth,
+               geometry.base_point[1], geometry.column_boundaries.tobytes())
+        layout = self._layout_cache.get(key)
+        if layout is None:
+            layout = self._remember(self._layout_cache, key,
+                                    self._compute_rebar_layout(floors, geometry, settings))
+        return layout
+    
+    def _compute_rebar_layout(self, floors: List[FloorData], geometry: ColumnGeometry,
+                              settings: ColumnSettings) -> RebarLayout:
+        """Compute rebar and stirrup layout from scratch"""
         main_bars = []
         stirrup_positions = []
         lap_lengths = []
@@ -70,18 +126,15 @@ class ColumnCalculator:
         
         for i, floor in enumerate(floors):
             floor_height = floor.total_height
-            column_length = floor.column_length
             concrete_cover = settings.concrete_cover
             
             # Calculate main bar positions
-            bars = self._calculate_main_bars(floor, geometry.column_boundaries[i], 
-                                           current_y, floor_height, concrete_cover)
-            main_bars.extend(bars)
+            main_bars.append(self._calculate_main_bars(floor, geometry.column_boundaries[i], 
+                                                       current_y, floor_height, concrete_cover))
             
             # Calculate stirrup positions
-            stirrups = self._calculate_stirrups(floor, current_y, floor_height, 
-                                              settings.beam_depth)
-            stirrup_positions.extend(stirrups)
+            stirrup_positions.append(self._calculate_stirrups(floor, current_y, floor_height, 
+                                                              settings.beam_depth))
             
             # Calculate lap lengths
             if i < len(floors) - 1:  # Not the top floor
@@ -91,62 +144,28 @@ class ColumnCalculator:
             
             current_y += floor_height
         
-        return RebarLayout(
-            main_bars=main_bars,
-            stirrup_positions=stirrup_positions,
+        layout = RebarLayout(
+            main_bars=np.concatenate(main_bars) if main_bars else np.empty((0, 4)),
+            stirrup_positions=np.concatenate(stirrup_positions) if stirrup_positions else np.empty(0, STIRRUP_DTYPE),
             lap_lengths=lap_lengths
         )
+        _freeze(layout.main_bars, layout.stirrup_positions)
+        return layout
     
     def _calculate_main_bars(self, floor: FloorData, boundaries: Tuple[float, float],
-                           base_y: float, height: float, cover: float) -> List[Tuple]:
+                           base_y: float, height: float, cover: float) -> np.ndarray:
         """Calculate positions for main reinforcement bars"""
-        bars = []
         left_x, right_x = boundaries
-        column_length = right_x - left_x
-        
-        # Edge bars
-        edge_x_left = left_x + cover
-        edge_x_right = right_x - cover
-        
-        bars.append((edge_x_left, base_y, base_y + height, floor.rebar_diameter))
-        bars.append((edge_x_right, base_y, base_y + height, floor.rebar_diameter))
-        
-        # Intermediate bars (if any)
-        if floor.rebar_amount_x > 2:
-            spacing = (column_length - 2 * cover) / (floor.rebar_amount_x - 1)
-            for i in range(1, floor.rebar_amount_x - 1):
-                x_pos = left_x + cover + i * spacing
-                bars.append((x_pos, base_y, base_y + height, floor.rebar_diameter))
-        
-        return bars
+        template = _main_bar_template(right_x - left_x, cover, floor.rebar_amount_x,
+                                      height, floor.rebar_diameter)
+        return template + (left_x, base_y, base_y, 0.0)
     
     def _calculate_stirrups(self, floor: FloorData, base_y: float, 
-                          height: float, beam_depth: float) -> List[Tuple]:
+                          height: float, beam_depth: float) -> np.ndarray:
         """Calculate stirrup positions"""
-        stirrups = []
-        net_height = height - beam_depth
-        
-        # Divide column into thirds
-        third_height = net_height / 3
-        
-        # Bottom third - edge spacing
-        current_y = base_y + floor.edge_stirrup_spacing
-        while current_y < base_y + third_height:
-            stirrups.append((current_y, 'edge', floor.stirrup_diameter))
-            current_y += floor.edge_stirrup_spacing
-        
-        # Middle third - mid spacing
-        current_y = base_y + third_height + floor.mid_stirrup_spacing
-        while current_y < base_y + 2 * third_height:
-            stirrups.append((current_y, 'mid', floor.stirrup_diameter))
-            current_y += floor.mid_stirrup_spacing
-        
-        # Top third - edge spacing (including beam zone)
-        current_y = base_y + 2 * third_height + floor.edge_stirrup_spacing
-        while current_y < base_y + height:
-            stirrups.append((current_y, 'edge', floor.stirrup_diameter))
-            current_y += floor.edge_stirrup_spacing
-        
+        stirrups = _stirrup_template(height, beam_depth, floor.edge_stirrup_spacing,
+                                     floor.mid_stirrup_spacing, floor.stirrup_diameter).copy()
+        stirrups['y'] += base_y
         return stirrups
     
     def _calculate_lap_length(self, bar_diameter: float) -> float:
@@ -167,32 +186,61 @@ class ColumnCalculator:
             'is_circular': floor.column_width == 0
         }
     
-    def _calculate_section_rebar_positions(self, floor: FloorData) -> List[Tuple[float, float]]:
-        """Calculate rebar positions in section view"""
-        positions = []
-        length = floor.column_length
-        width = floor.column_width if floor.column_width > 0 else length
-        cover = 25.0  # Default cover
-        
-        if floor.column_width > 0:  # Rectangular section
-            # Calculate positions for rectangular arrangement
-            x_spacing = (length - 2 * cover) / (floor.rebar_amount_x - 1)
-            y_spacing = (width - 2 * cover) / (floor.rebar_amount_y - 1)
-            
-            for i in range(floor.rebar_amount_x):
-                for j in range(floor.rebar_amount_y):
-                    x = cover + i * x_spacing
-                    y = cover + j * y_spacing
-                    positions.append((x, y))
-        else:  # Circular section
-            # Circular arrangement
-            radius = (length / 2) - cover
-            angle_step = 2 * math.pi / floor.rebar_amount_x
-            
-            for i in range(floor.rebar_amount_x):
-                angle = i * angle_step
-                x = length / 2 + radius * math.cos(angle)
-                y = length / 2 + radius * math.sin(angle)
-                positions.append((x, y))
-        
-        return positions
\ No newline at end of file
+    def _calculate_section_rebar_positions(self, floor: FloorData) -> np.ndarray:
+        """Calculate rebar positions in section view as an (N, 2) array of (x, y)"""
+        return _section_rebar_template(floor.column_length, floor.column_width,
+                                       floor.rebar_amount_x, floor.rebar_amount_y)
+
+
+# Layout templates below are cached per floor signature: columns of a building
+# mostly repeat the same floor schedule. Templates sit at the origin and are
+# read-only; callers translate them into place, which yields a new array.
+
+@lru_cache(maxsize=256)
+def _main_bar_template(column_length: float, cover: float, rebar_amount_x: int,
+                       height: float, diameter: float) -> np.ndarray:
+    """Main bars of one floor as (x, start_y, end_y, diameter) rows, from left_x and base_y 0"""
+    # Edge bars at the covers, intermediate bars (if any) evenly between
+    count = max(rebar_amount_x, 2)
+    bars = np.empty((count, 4))
+    bars[:, 0] = np.linspace(cover, column_length - cover, count)
+    bars[:, 1] = 0.0
+    bars[:, 2] = height
+    bars[:, 3] = diameter
+    bars.flags.writeable = False
+    return bars
+
+@lru_cache(maxsize=256)
+def _stirrup_template(height: float, beam_depth: float, edge_spacing: float,
+                      mid_spacing: float, diameter: float) -> np.ndarray:
+    """Stirrups of one floor as STIRRUP_DTYPE records, from base_y 0"""
+    bottom, middle, top = stirrup_zones(0.0, height, beam_depth, edge_spacing, mid_spacing)
+    
+    stirrups = np.empty(len(bottom) + len(middle) + len(top), STIRRUP_DTYPE)
+    stirrups['y'] = np.concatenate((bottom, middle, top))
+    stirrups['spacing_type'] = EDGE_SPACING
+    stirrups['spacing_type'][len(bottom):len(bottom) + len(middle)] = MID_SPACING
+    stirrups['diameter'] = diameter
+    stirrups.flags.writeable = False
+    return stirrups
+
+@lru_cache(maxsize=64)
+def _section_rebar_template(length: float, column_width: float,
+                            rebar_amount_x: int, rebar_amount_y: int) -> np.ndarray:
+    """Section rebar positions as (x, y) rows; column_width 0 means circular"""
+    cover = 25.0  # Default cover
+    
+    if column_width > 0:  # Rectangular section
+        # Calculate positions for rectangular arrangement
+        xs = np.linspace(cover, length - cover, rebar_amount_x)
+        ys = np.linspace(cover, column_width - cover, rebar_amount_y)
+        xx, yy = np.meshgrid(xs, ys, indexing='ij')
+        positions = np.column_stack((xx.ravel(), yy.ravel()))
+    else:  # Circular section
+        radius = (length / 2) - cover
+        angles = np.arange(rebar_amount_x) * (2 * math.pi / rebar_amount_x)
+        positions = np.column_stack((length / 2 + radius * np.cos(angles),
+                                     length / 2 + radius * np.sin(angles)))
+    
+    positions.flags.writeable = False
+    return positions
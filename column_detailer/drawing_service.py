@@ -3,9 +3,10 @@ Main drawing service for column details
 """
 
 import logging
-from typing import List, Dict, Any, Tuple
-from .autocad_manager import AutoCADManager, DrawingContext
-from .excel_reader import ColumnData, FloorData
+import numpy as np
+from typing import Dict, Any, Tuple
+from .autocad_manager import AutoCADManager, DrawingContext, point
+from .excel_reader import ColumnData, FloorData, ColumnSettings
 from .column_calculator import ColumnCalculator, ColumnGeometry, RebarLayout
 
 class ColumnDrawingService:
@@ -109,34 +110,23 @@ class ColumnDrawingService:
         if settings.foundation_depth > 0 and not settings.is_foundation_string:
             self._draw_foundation(geometry, settings)
         
-        # Draw each floor
-        for i, (floor, (left_x, right_x)) in enumerate(zip(column_data.floors, geometry.column_boundaries)):
-            floor_base_y = geometry.floor_levels[i]
-            floor_height = floor.total_height - settings.beam_depth
-            
-            # Draw column
-            self.autocad.model_space.AddLine(
-                (left_x, floor_base_y, base_z), 
-                (left_x, floor_base_y + floor_height, base_z)
-            )
-            self.autocad.model_space.AddLine(
-                (right_x, floor_base_y, base_z), 
-                (right_x, floor_base_y + floor_height, base_z)
-            )
-            
-            # Draw beams
-            beam_y = floor_base_y + floor_height
-            beam_left = left_x - settings.beam_extension
-            beam_right = right_x + settings.beam_extension
-            
-            self.autocad.model_space.AddLine(
-                (beam_left, beam_y, base_z), 
-                (beam_right, beam_y, base_z)
-            )
-            self.autocad.model_space.AddLine(
-                (beam_left, beam_y + settings.beam_depth, base_z), 
-                (beam_right, beam_y + settings.beam_depth, base_z)
-            )
+        # Column edges and beam lines of every floor, drawn in one batch
+        floor_count = len(geometry.column_boundaries)
+        left_x, right_x = geometry.column_boundaries.T
+        floor_base_y = geometry.floor_levels[:floor_count]
+        beam_y = floor_base_y + geometry.floor_heights - settings.beam_depth
+        beam_left = left_x - settings.beam_extension
+        beam_right = right_x + settings.beam_extension
+        
+        # Four (x1, y1, x2, y2) segments per floor: two column edges, two beam edges
+        segments = np.empty((floor_count, 4, 6))
+        segments[:, :, [2, 5]] = base_z
+        segments[:, 0, [0, 1, 3, 4]] = np.column_stack((left_x, floor_base_y, left_x, beam_y))
+        segments[:, 1, [0, 1, 3, 4]] = np.column_stack((right_x, floor_base_y, right_x, beam_y))
+        segments[:, 2, [0, 1, 3, 4]] = np.column_stack((beam_left, beam_y, beam_right, beam_y))
+        segments[:, 3, [0, 1, 3, 4]] = np.column_stack((beam_left, beam_y + settings.beam_depth,
+                                                        beam_right, beam_y + settings.beam_depth))
+        self.autocad.add_lines(segments)
     
     def _draw_foundation(self, geometry: ColumnGeometry, settings: ColumnSettings):
         """Draw foundation"""
@@ -154,72 +144,68 @@ class ColumnDrawingService:
             (foundation_left, foundation_top),
             (foundation_right, foundation_top),
             (foundation_right, foundation_bottom),
-            (foundation_left, foundation_bottom),
-            (foundation_left, foundation_top)
+            (foundation_left, foundation_bottom)
         ]
         
-        # Convert to 3D points
-        points_3d = []
-        for x, y in points:
-            points_3d.extend([x, y, base_z])
-        
-        polyline = self.autocad.model_space.AddLightWeightPolyline(points_3d[:6])  # First 4 points for polyline
-        polyline.Closed = True
+        self.autocad.add_polyline(points, closed=True)
     
-    def _draw_main_rebars(self, main_bars: List[Tuple]):
+    def _draw_main_rebars(self, main_bars: np.ndarray):
         """Draw main reinforcement bars"""
-        for x, start_y, end_y, diameter in main_bars:
-            # Draw bar as a line
-            self.autocad.model_space.AddLine(
-                (x, start_y, 0), 
-                (x, end_y, 0)
-            )
-            
-            # Add diameter indicator (simplified)
-            text_point = (x + 50, (start_y + end_y) / 2, 0)
-            self.autocad.model_space.AddText(
-                f"Ø{diameter}", 
-                text_point, 
-                2.5
-            )
+        if not len(main_bars):
+            return
+        
+        x, start_y, end_y, diameter = main_bars.T
+        zeros = np.zeros(len(main_bars))
+        
+        # Draw bars as lines
+        self.autocad.add_lines(np.column_stack((x, start_y, zeros, x, end_y, zeros)))
+        
+        # Add diameter indicator (simplified)
+        labels = [f"Ø{bar_diameter}" for bar_diameter in diameter.tolist()]
+        self.autocad.add_texts(labels, np.column_stack((x + 50, (start_y + end_y) / 2)), 2.5)
     
-    def _draw_stirrups(self, stirrups: List[Tuple], boundaries: List[Tuple]):
+    def _draw_stirrups(self, stirrups: np.ndarray, boundaries: np.ndarray):
         """Draw stirrups"""
-        for y, spacing_type, diameter in stirrups:
-            if boundaries:
-                left_x, right_x = boundaries[0]  # Use first floor boundaries for simplicity
-                
-                # Draw stirrup as horizontal line
-                self.autocad.model_space.AddLine(
-                    (left_x, y, 0), 
-                    (right_x, y, 0)
-                )
+        if len(stirrups) and len(boundaries):
+            left_x, right_x = boundaries[0]  # Use first floor boundaries for simplicity
+            
+            # Draw stirrups as horizontal lines
+            y = stirrups['y']
+            segments = np.zeros((len(y), 6))
+            segments[:, 0] = left_x
+            segments[:, 1] = y
+            segments[:, 3] = right_x
+            segments[:, 4] = y
+            self.autocad.add_lines(segments)
     
     def _draw_dimensions(self, column_data: ColumnData, geometry: ColumnGeometry):
         """Draw dimensions"""
         base_x, base_y, base_z = geometry.base_point
         settings = column_data.settings
         
+        if not len(geometry.column_boundaries):
+            return
+        
+        # Height dimensions sit right of the widest floor
+        dim_x = base_x + geometry.column_boundaries[:, 1].max() + 100
+        
         # Draw height dimensions
         for i, level in enumerate(geometry.floor_levels):
             if i < len(column_data.floors):
                 floor_name = column_data.floors[i].floor_name
                 
-                # Add height dimension
-                dim_x = base_x + max([b[1] for b in geometry.column_boundaries]) + 100
-                
                 if i > 0:
                     prev_level = geometry.floor_levels[i-1]
                     height = level - prev_level
                     
                     # Draw dimension line
                     self.autocad.model_space.AddLine(
-                        (dim_x, prev_level, base_z), 
-                        (dim_x, level, base_z)
+                        point(dim_x, prev_level, base_z), 
+                        point(dim_x, level, base_z)
                     )
                     
                     # Add dimension text
-                    text_point = (dim_x + 20, (prev_level + level) / 2, base_z)
+                    text_point = point(dim_x + 20, (prev_level + level) / 2, base_z)
                     self.autocad.model_space.AddText(
                         f"{height:.0f}", 
                         text_point, 
@@ -231,7 +217,7 @@ class ColumnDrawingService:
         base_x, base_y, base_z = geometry.base_point
         
         # Column title
-        title_point = (base_x, geometry.floor_levels[-1] + 100, base_z)
+        title_point = point(base_x, geometry.floor_levels[-1] + 100, base_z)
         self.autocad.model_space.AddText(
             f"COLUMN-{column_number}", 
             title_point, 
@@ -242,7 +228,7 @@ class ColumnDrawingService:
         for i, level in enumerate(geometry.floor_levels[:-1]):  # Exclude top level
             if i < len(column_data.floors):
                 floor = column_data.floors[i]
-                label_point = (base_x - 150, level + floor.total_height / 2, base_z)
+                label_point = point(base_x - 150, level + floor.total_height / 2, base_z)
                 self.autocad.model_space.AddText(
                     floor.floor_name, 
                     label_point, 
@@ -261,7 +247,7 @@ class ColumnDrawingService:
             # Draw circular section
             radius = length / 2
             self.autocad.model_space.AddCircle(
-                (ip_x, ip_y, ip_z), 
+                point(ip_x, ip_y, ip_z), 
                 radius
             )
         else:
@@ -271,16 +257,12 @@ class ColumnDrawingService:
             right = ip_x + length / 2
             top = ip_y + width / 2
             
-            points = [left, bottom, right, bottom, right, top, left, top, left, bottom]
-            polyline = self.autocad.model_space.AddLightWeightPolyline(points)
-            polyline.Closed = True
+            points = [(left, bottom), (right, bottom), (right, top), (left, top)]
+            self.autocad.add_polyline(points, closed=True)
         
-        # Draw rebars in section
-        for rebar_x, rebar_y in section_data['rebar_positions']:
-            scaled_x = ip_x - length / 2 + rebar_x * scale
-            scaled_y = ip_y - width / 2 + rebar_y * scale
-            
-            self.autocad.model_space.AddCircle(
-                (scaled_x, scaled_y, ip_z), 
-                floor.rebar_diameter * scale / 2
-            )
\ No newline at end of file
+        # Draw rebars in section, scaled and moved into place in one pass
+        offset = (ip_x - length / 2, ip_y - width / 2)
+        rebar_radius = floor.rebar_diameter * scale / 2
+        add_circle = self.autocad.model_space.AddCircle
+        for scaled_x, scaled_y in (section_data['rebar_positions'] * scale + offset).tolist():
+            add_circle(point(scaled_x, scaled_y, ip_z), rebar_radius)
\ No newline at end of file
@@ -0,0 +1,37 @@
+"""
+Array helpers shared by the entity classes
+"""
+
+from typing import Optional
+import numpy as np
+
+class GrowableArray:
+    """Append-only float64 array with amortized O(1) appends
+    
+    Capacity doubles when full; values returns a view of the filled rows.
+    """
+    
+    __slots__ = ('_data', '_size')
+    
+    def __init__(self, width: Optional[int] = None, capacity: int = 8):
+        shape = (capacity,) if width is None else (capacity, width)
+        self._data = np.empty(shape)
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    @property
+    def values(self) -> np.ndarray:
+        return self._data[:self._size]
+    
+    def append(self, value):
+        if self._size == len(self._data):
+            grown = np.empty((2 * len(self._data),) + self._data.shape[1:])
+            grown[:self._size] = self._data
+            self._data = grown
+        self._data[self._size] = value
+        self._size += 1
+    
+    def clear(self):
+        self._size = 0
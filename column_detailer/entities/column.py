@@ -5,8 +5,15 @@ Column entity classes
 from dataclasses import dataclass
 from typing import List, Tuple, Optional
 import math
+import sys
+import numpy as np
+from ._arrays import GrowableArray
 
-@dataclass
+# Slotted dataclasses drop the per-instance __dict__ of the many small
+# geometry objects; dataclass(slots=...) needs Python 3.10+
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**DATACLASS_SLOTS)
 class Point3D:
     """3D point representation"""
     x: float
@@ -19,7 +26,7 @@ class Point3D:
     def offset(self, dx: float = 0, dy: float = 0, dz: float = 0) -> 'Point3D':
         return Point3D(self.x + dx, self.y + dy, self.z + dz)
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Rectangle:
     """Rectangle representation"""
     lower_left: Point3D
@@ -50,41 +57,43 @@ class Rectangle:
         ]
 
 class Column:
-    """Column entity representing a structural column"""
+    """Column entity representing a structural column
+    
+    Floor heights and lengths are also kept as arrays for the aggregate
+    queries; they are read when a floor is added.
+    """
     
     def __init__(self, name: str = "Column"):
         self.name = name
-        self.floors: List[ColumnFloor] = []
+        self._floors: List[ColumnFloor] = []
         self.base_point = Point3D(0, 0, 0)
         self.settings = None
+        self._heights = GrowableArray()
+        self._lengths = GrowableArray()
+    
+    @property
+    def floors(self) -> Tuple['ColumnFloor', ...]:
+        """Floors from the bottom up; read-only, use add_floor"""
+        return tuple(self._floors)
     
     def add_floor(self, floor: 'ColumnFloor'):
         """Add a floor to the column"""
-        self.floors.append(floor)
+        self._floors.append(floor)
+        self._heights.append(floor.height)
+        self._lengths.append(floor.length)
     
     def get_total_height(self) -> float:
         """Get total height of column"""
-        return sum(floor.height for floor in self.floors)
+        return float(self._heights.values.sum())
     
-    def get_floor_levels(self) -> List[float]:
+    def get_floor_levels(self) -> np.ndarray:
         """Get Y-coordinates of each floor level"""
-        levels = [self.base_point.y]
-        current_y = self.base_point.y
-        
-        for floor in self.floors:
-            current_y += floor.height
-            levels.append(current_y)
-        
-        return levels
-    
-    def get_floor_boundaries(self) -> List[Tuple[float, float]]:
-        """Get left and right boundaries for each floor"""
-        boundaries = []
-        for floor in self.floors:
-            left = self.base_point.x - floor.length / 2
-            right = self.base_point.x + floor.length / 2
-            boundaries.append((left, right))
-        return boundaries
+        return self.base_point.y + np.concatenate(([0.0], np.cumsum(self._heights.values)))
+    
+    def get_floor_boundaries(self) -> np.ndarray:
+        """Get left and right boundaries for each floor as (N, 2) rows"""
+        half_lengths = self._lengths.values / 2
+        return np.column_stack((self.base_point.x - half_lengths, self.base_point.x + half_lengths))
 
 class ColumnFloor:
     """Represents a single floor in a column"""
@@ -117,15 +126,20 @@ class ColumnSection:
         self.floor = floor
         self.scale = scale
         self.rebar_positions: List[Point3D] = []
+        # Rebar positions as an (N, 2) array of x, y rows
+        self.rebar_positions_xy = np.empty((0, 2))
         
     def calculate_rebar_positions(self, cover: float = 25.0):
         """Calculate rebar positions in section"""
         self.rebar_positions = []
+        self.rebar_positions_xy = np.empty((0, 2))
         
         if self.floor.is_circular:
             self._calculate_circular_positions(cover)
         else:
             self._calculate_rectangular_positions(cover)
+            if self.rebar_positions:
+                self.rebar_positions_xy = np.array([(p.x, p.y) for p in self.rebar_positions])
     
     def _calculate_circular_positions(self, cover: float):
         """Calculate rebar positions for circular section"""
@@ -134,13 +148,11 @@ class ColumnSection:
         center_y = self.floor.width / 2 if self.floor.width > 0 else center_x
         
         if self.floor.reinforcement:
-            angle_step = 2 * math.pi / self.floor.reinforcement.main_bars_count
-            
-            for i in range(self.floor.reinforcement.main_bars_count):
-                angle = i * angle_step
-                x = center_x + radius * math.cos(angle)
-                y = center_y + radius * math.sin(angle)
-                self.rebar_positions.append(Point3D(x, y, 0))
+            count = self.floor.reinforcement.main_bars_count
+            angles = np.linspace(0, 2 * np.pi, count, endpoint=False)
+            self.rebar_positions_xy = np.column_stack((center_x + radius * np.cos(angles),
+                                                       center_y + radius * np.sin(angles)))
+            self.rebar_positions = [Point3D(x, y, 0) for x, y in self.rebar_positions_xy.tolist()]
     
     def _calculate_rectangular_positions(self, cover: float):
         """Calculate rebar positions for rectangular section"""
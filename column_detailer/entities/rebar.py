@@ -4,9 +4,38 @@ Rebar entity classes
 
 from dataclasses import dataclass
 from typing import List, Tuple
-from .column import Point3D
+import math
+import numpy as np
+from ._arrays import GrowableArray
+from .column import Point3D, DATACLASS_SLOTS
 
-@dataclass
+def stirrup_elevations(start_y: float, height: float, beam_depth: float,
+                       edge_spacing: float, mid_spacing: float) -> np.ndarray:
+    """Stirrup Y-coordinates: edge spacing in the outer thirds, mid spacing in the middle"""
+    return np.concatenate(stirrup_zones(start_y, height, beam_depth, edge_spacing, mid_spacing))
+
+def stirrup_zones(start_y: float, height: float, beam_depth: float, edge_spacing: float,
+                  mid_spacing: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Stirrup Y-coordinates of the bottom, middle and top thirds of a column"""
+    third_height = (height - beam_depth) / 3
+    return (
+        _zone(start_y + edge_spacing, start_y + third_height, edge_spacing),  # Bottom third
+        _zone(start_y + third_height + mid_spacing, start_y + 2 * third_height, mid_spacing),  # Middle third
+        _zone(start_y + 2 * third_height + edge_spacing, start_y + height, edge_spacing),  # Top third (including beam zone)
+    )
+
+def _zone(first: float, stop: float, spacing: float) -> np.ndarray:
+    """Positions first, first + spacing, ... strictly below stop
+
+    Each position is computed directly from its index, so no rounding error
+    builds up along the progression.
+    """
+    if spacing <= 0:
+        raise ValueError(f"Stirrup spacing must be positive: {spacing}")
+    count = max(0, math.ceil((stop - first) / spacing))
+    return first + spacing * np.arange(count)
+
+@dataclass(**DATACLASS_SLOTS)
 class Rebar:
     """Single rebar representation"""
     diameter: float
@@ -33,44 +62,70 @@ class Rebar:
         """Check if rebar is horizontal"""
         return abs(self.start_point.y - self.end_point.y) < 0.001
 
+# π/4 turns d² into a bar area; /1000 converts the volume to m³
+_AREA_VOLUME_FACTOR = math.pi * 0.25 / 1000
+
 class RebarLayout:
-    """Complete rebar layout for a column"""
+    """Complete rebar layout for a column
+    
+    Diameters and end points of all bars (main bars and links) are kept as
+    arrays for the totals; bars must be added through add_main_bar/add_link.
+    """
     
     def __init__(self):
-        self.main_bars: List[Rebar] = []
-        self.links: List[Rebar] = []
+        self._main_bars: List[Rebar] = []
+        self._links: List[Rebar] = []
         self.main_bars_x: int = 0
         self.main_bars_y: int = 0
+        self._diameters = GrowableArray()
+        self._starts = GrowableArray(width=3)
+        self._ends = GrowableArray(width=3)
         
+    @property
+    def main_bars(self) -> Tuple[Rebar, ...]:
+        """Main bars in the order they were added; read-only, use add_main_bar"""
+        return tuple(self._main_bars)
+    
+    @property
+    def links(self) -> Tuple[Rebar, ...]:
+        """Links in the order they were added; read-only, use add_link"""
+        return tuple(self._links)
+    
     @property
     def main_bars_count(self) -> int:
         """Total number of main bars"""
-        return len(self.main_bars)
+        return len(self._main_bars)
     
     def add_main_bar(self, rebar: Rebar):
         """Add a main bar"""
-        self.main_bars.append(rebar)
+        self._main_bars.append(rebar)
+        self._track(rebar)
     
     def add_link(self, rebar: Rebar):
         """Add a link/stirrup"""
-        self.links.append(rebar)
+        self._links.append(rebar)
+        self._track(rebar)
+    
+    def _track(self, rebar: Rebar):
+        """Record the bar's diameter and end points in the aggregate arrays"""
+        start, end = rebar.start_point, rebar.end_point
+        self._diameters.append(rebar.diameter)
+        self._starts.append((start.x, start.y, start.z))
+        self._ends.append((end.x, end.y, end.z))
+    
+    def get_lengths(self) -> np.ndarray:
+        """Lengths of all bars (main bars and links) in the order they were added"""
+        return np.linalg.norm(self._ends.values - self._starts.values, axis=1)
     
     def get_total_length(self) -> float:
         """Get total length of all rebars"""
-        total = sum(bar.length for bar in self.main_bars)
-        total += sum(link.length for link in self.links)
-        return total
+        return float(self.get_lengths().sum())
     
     def get_total_weight(self, density: float = 7850) -> float:
         """Get total weight of rebars in kg"""
-        total_volume = 0.0
-        
-        for bar in self.main_bars + self.links:
-            area = math.pi * (bar.diameter / 2) ** 2
-            volume = area * bar.length / 1000  # Convert to m³
-            total_volume += volume
-        
-        return total_volume * density  # kg
+        diameters = self._diameters.values
+        # Sum of d² · length in one dot product; π/4 and the m³ conversion applied once
+        return float(np.dot(diameters * diameters, self.get_lengths())) * _AREA_VOLUME_FACTOR * density  # kg
 
 class StirrupLayout:
     """Stirrup/link layout configuration"""
@@ -83,29 +138,8 @@ class StirrupLayout:
     
     def calculate_positions(self, start_y: float, height: float, beam_depth: float):
         """Calculate stirrup positions"""
-        self.positions = []
-        net_height = height - beam_depth
-        
-        # Divide into thirds
-        third_height = net_height / 3
-        
-        # Bottom third - edge spacing
-        current_y = start_y + self.edge_spacing
-        while current_y < start_y + third_height:
-            self.positions.append(current_y)
-            current_y += self.edge_spacing
-        
-        # Middle third - mid spacing
-        current_y = start_y + third_height + self.mid_spacing
-        while current_y < start_y + 2 * third_height:
-            self.positions.append(current_y)
-            current_y += self.mid_spacing
-        
-        # Top third - edge spacing
-        current_y = start_y + 2 * third_height + self.edge_spacing
-        while current_y < start_y + height:
-            self.positions.append(current_y)
-            current_y += self.edge_spacing
+        self.positions = stirrup_elevations(start_y, height, beam_depth,
+                                            self.edge_spacing, self.mid_spacing).tolist()
     
     def get_spacing_at_height(self, y: float, start_y: float, height: float) -> float:
         """Get stirrup spacing at specific height"""
@@ -3,11 +3,14 @@ Stirrup entity classes
 """
 
 from dataclasses import dataclass
-from typing import List, Tuple
-from .column import Point3D
+from typing import Dict, List, Tuple
+from ._arrays import GrowableArray
+from .column import Point3D, DATACLASS_SLOTS
+from .rebar import stirrup_elevations
 import math
+import numpy as np
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Stirrup:
     """Single stirrup representation"""
     diameter: float
@@ -38,6 +41,8 @@ class Stirrup:
 class RectangularStirrup(Stirrup):
     """Rectangular stirrup"""
     
+    __slots__ = ('width', 'height', 'center_x')
+    
     def __init__(self, diameter: float, elevation: float, 
                  width: float, height: float, center_x: float = 0):
         self.diameter = diameter
@@ -64,6 +69,23 @@ class RectangularStirrup(Stirrup):
 class CircularStirrup(Stirrup):
     """Circular stirrup/helix"""
     
+    __slots__ = ('column_diameter', 'center_x', 'segments')
+    
+    # Unit-circle (cos, sin) tables per segment count, shared by all instances
+    _trig_cache: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+    
+    @classmethod
+    def _unit_circle(cls, segments: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Cosines and sines of the segment angles, computed once per segment count"""
+        table = cls._trig_cache.get(segments)
+        if table is None:
+            angles = 2 * np.pi * np.arange(segments) / segments
+            cos_t, sin_t = np.cos(angles), np.sin(angles)
+            cos_t.flags.writeable = False
+            sin_t.flags.writeable = False
+            table = cls._trig_cache.setdefault(segments, (cos_t, sin_t))
+        return table
+    
     def __init__(self, diameter: float, elevation: float, 
                  column_diameter: float, center_x: float = 0,
                  segments: int = 16):
@@ -75,36 +97,62 @@ class CircularStirrup(Stirrup):
         
         # Calculate circular positions
         radius = column_diameter / 2 - diameter / 2
-        positions = []
-        
-        for i in range(segments):
-            angle = 2 * math.pi * i / segments
-            x = center_x + radius * math.cos(angle)
-            y = elevation + radius * math.sin(angle)
-            positions.append(Point3D(x, y, 0))
+        cos_t, sin_t = self._unit_circle(segments)
+        xs = (center_x + radius * cos_t).tolist()
+        ys = (elevation + radius * sin_t).tolist()
+        positions = [Point3D(x, y, 0) for x, y in zip(xs, ys)]
         
         super().__init__(diameter, positions, elevation)
 
 class StirrupPattern:
-    """Complete stirrup pattern for a column"""
+    """Complete stirrup pattern for a column
+    
+    Stirrup elevations are kept as an array for the range queries; stirrups
+    must be added through add_stirrup.
+    """
     
     def __init__(self):
-        self.stirrups: List[Stirrup] = []
+        self._stirrups: List[Stirrup] = []
         self.diameter: float = 8.0
         self.edge_spacing: float = 100.0
         self.mid_spacing: float = 150.0
+        # Stirrup elevations, and their sort order once a range query needs it
+        self._elevations = GrowableArray()
+        self._order = None
+    
+    @property
+    def stirrups(self) -> Tuple[Stirrup, ...]:
+        """Stirrups in the order they were added; read-only, use add_stirrup"""
+        return tuple(self._stirrups)
     
     def add_stirrup(self, stirrup: Stirrup):
         """Add a stirrup to the pattern"""
-        self.stirrups.append(stirrup)
+        self._stirrups.append(stirrup)
+        self._elevations.append(stirrup.elevation)
+        self._order = None
+    
+    def clear(self):
+        """Remove all stirrups"""
+        self._stirrups.clear()
+        self._elevations.clear()
+        self._order = None
     
     def get_stirrups_in_range(self, start_y: float, end_y: float) -> List[Stirrup]:
         """Get stirrups within elevation range"""
-        return [s for s in self.stirrups if start_y <= s.elevation <= end_y]
+        elevations = self._elevations.values
+        if self._order is None:
+            self._order = np.argsort(elevations, kind='stable')
+        
+        sorted_elevations = elevations[self._order]
+        lo = np.searchsorted(sorted_elevations, start_y, side='left')
+        hi = np.searchsorted(sorted_elevations, end_y, side='right')
+        
+        # Back to insertion order, as the stirrups were added
+        return [self._stirrups[i] for i in np.sort(self._order[lo:hi]).tolist()]
     
     def get_total_length(self) -> float:
         """Get total length of all stirrups"""
-        return sum(stirrup.perimeter for stirrup in self.stirrups)
+        return sum(stirrup.perimeter for stirrup in self._stirrups)
     
     def get_total_weight(self, density: float = 7850) -> float:
         """Get total weight of stirrups in kg"""
@@ -117,35 +165,11 @@ class StirrupPattern:
                                    beam_depth: float, width: float, 
                                    column_width: float, center_x: float = 0):
         """Generate rectangular stirrup pattern"""
-        self.stirrups.clear()
-        net_height = height - beam_depth
-        
-        # Calculate positions using the same logic as calculator
-        third_height = net_height / 3
-        
-        # Bottom third
-        current_y = start_y + self.edge_spacing
-        while current_y < start_y + third_height:
-            stirrup = RectangularStirrup(
-                self.diameter, current_y, width, column_width, center_x
-            )
-            self.stirrups.append(stirrup)
-            current_y += self.edge_spacing
-        
-        # Middle third
-        current_y = start_y + third_height + self.mid_spacing
-        while current_y < start_y + 2 * third_height:
-            stirrup = RectangularStirrup(
-                self.diameter, current_y, width, column_width, center_x
-            )
-            self.stirrups.append(stirrup)
-            current_y += self.mid_spacing
+        self.clear()
+        elevations = stirrup_elevations(start_y, height, beam_depth,
+                                        self.edge_spacing, self.mid_spacing)
         
-        # Top third
-        current_y = start_y + 2 * third_height + self.edge_spacing
-        while current_y < start_y + height:
-            stirrup = RectangularStirrup(
-                self.diameter, current_y, width, column_width, center_x
-            )
-            self.stirrups.append(stirrup)
-            current_y += self.edge_spacing
\ No newline at end of file
+        for elevation in elevations.tolist():
+            self.add_stirrup(RectangularStirrup(
+                self.diameter, elevation, width, column_width, center_x
+            ))